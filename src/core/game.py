@@ -5,8 +5,16 @@ Manages Pygame initialization, event handling, FPS control, and delta time calcu
 import pygame
 import sys
 import json
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # orjson is optional; fall back to the standard library parser
+    _json_loads = json.loads
 from .resource_manager import ResourceManager
 from scenes.scene_manager import SceneManager
 
@@ -17,6 +25,32 @@ class Game:
     Handles Pygame initialization, event processing, FPS control, and delta time.
     """
     
+    __slots__ = (
+        'running', 'clock', 'screen', 'resource_manager', 'scene_manager',
+        'font_cache', 'text_cache', 'hud_value_cache', 'config',
+        'screen_width', 'screen_height', 'window_title', 'target_fps',
+        'debug_mode', 'delta_time', 'last_frame_time',
+        '_needs_clear', '_keydown_handlers',
+    )
+    
+    # Event types the game and its scenes actually consume; everything else is
+    # blocked at the SDL queue so it never reaches Python.
+    _EVENT_FILTER = (
+        pygame.QUIT,
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEMOTION,
+        pygame.USEREVENT,
+    )
+    
+    # Upper bound for a single frame's delta time in seconds (debugger pauses, window drags)
+    MAX_DELTA_TIME = 0.1
+    
+    # Portion of the frame budget (seconds) spent spinning instead of sleeping
+    FRAME_SPIN_TIME = 0.002
+    
     def __init__(self, config_path: str = "config/settings.json"):
         """
         Initialize the Game instance.
@@ -30,6 +64,11 @@ class Game:
         self.resource_manager: Optional[ResourceManager] = None
         self.scene_manager: Optional[SceneManager] = None
         
+        # Font and static text caches for HUD/placeholder rendering
+        self.font_cache: Dict[int, pygame.font.Font] = {}
+        self.text_cache: Dict[Tuple[str, int, Tuple[int, int, int]], pygame.Surface] = {}
+        self.hud_value_cache: Dict[str, Tuple[str, pygame.Surface]] = {}
+        
         # Load configuration
         self.config = self._load_config(config_path)
         
@@ -39,9 +78,21 @@ class Game:
         self.window_title = self.config.get("display", {}).get("title", "Zelda-like 2D Game")
         self.target_fps = self.config.get("display", {}).get("fps", 60)
         
+        # Game settings read in per-frame paths
+        self.debug_mode = self.config.get("game", {}).get("debug_mode", False)
+        
         # Game state
         self.delta_time = 0.0
-        self.last_frame_time = 0
+        self.last_frame_time = time.perf_counter()
+        
+        # Whether the screen must be cleared before the scene renders
+        self._needs_clear = True
+        
+        # Key press handlers, looked up by key code
+        self._keydown_handlers = {
+            pygame.K_ESCAPE: self.quit,
+            pygame.K_F1: self._toggle_debug,  # Debug information toggle
+        }
         
         # Initialize Pygame and systems
         self._initialize_pygame()
@@ -58,8 +109,8 @@ class Game:
             Dictionary containing configuration data
         """
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(config_path, 'rb') as f:
+                return _json_loads(f.read())
         except (FileNotFoundError, json.JSONDecodeError) as e:
             print(f"Warning: Failed to load config from {config_path}: {e}")
             print("Using default configuration.")
@@ -81,12 +132,26 @@ class Game:
         """Initialize Pygame and create the main window."""
         try:
             pygame.init()
-            pygame.mixer.init()
+            # pygame.init() auto-opens the audio device; release it until the
+            # first sound is loaded (see ResourceManager.ensure_audio)
+            pygame.mixer.quit()
             
-            # Create the main window
-            self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+            # Create the main window, double-buffered when the driver allows it.
+            # Frame pacing is left to _frame_wait alone: vsync would need the
+            # SCALED flag (which changes how the window scales) and would pace
+            # frames a second time when the refresh rate differs from target_fps.
+            try:
+                self.screen = pygame.display.set_mode(
+                    (self.screen_width, self.screen_height),
+                    pygame.DOUBLEBUF
+                )
+            except pygame.error:
+                # Older SDL or headless drivers may reject the flag
+                self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
             pygame.display.set_caption(self.window_title)
             
+            self._configure_event_queue()
+            
             print(f"Pygame initialized successfully")
             print(f"Window: {self.screen_width}x{self.screen_height}")
             print(f"Target FPS: {self.target_fps}")
@@ -95,6 +160,15 @@ class Game:
             print(f"Failed to initialize Pygame: {e}")
             sys.exit(1)
     
+    def _configure_event_queue(self) -> None:
+        """Restrict the SDL event queue to the event types listed in _EVENT_FILTER."""
+        try:
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(self._EVENT_FILTER)
+        except pygame.error:
+            # Event filtering is an optimization only; keep the default queue
+            pass
+    
     def _initialize_systems(self) -> None:
         """Initialize game systems like resource manager and scene manager."""
         try:
@@ -127,12 +201,12 @@ class Game:
         """
         print("Starting game loop...")
         self.running = True
-        self.last_frame_time = pygame.time.get_ticks()
+        self.last_frame_time = time.perf_counter()
         
         while self.running:
-            # Calculate delta time
-            current_time = pygame.time.get_ticks()
-            self.delta_time = (current_time - self.last_frame_time) / 1000.0  # Convert to seconds
+            # Calculate delta time in seconds with sub-millisecond precision
+            current_time = time.perf_counter()
+            self.delta_time = min(current_time - self.last_frame_time, self.MAX_DELTA_TIME)
             self.last_frame_time = current_time
             
             # Handle events
@@ -145,29 +219,62 @@ class Game:
             self.render()
             
             # Control frame rate
-            self.clock.tick(self.target_fps)
+            self._frame_wait(current_time)
         
         # Cleanup
         self.cleanup()
     
+    def _frame_wait(self, frame_start: float) -> None:
+        """
+        Wait until the current frame's time budget is used up.
+        Sleeps for the bulk of the remaining time and spins on perf_counter
+        for the last couple of milliseconds, avoiding the coarse granularity
+        of SDL_Delay.
+        
+        Args:
+            frame_start: perf_counter timestamp taken at the start of the frame
+        """
+        # Keep the clock ticking (without delay) so get_fps() stays valid
+        self.clock.tick()
+        
+        if self.target_fps <= 0:
+            return
+        
+        target = 1.0 / self.target_fps
+        remaining = target - (time.perf_counter() - frame_start)
+        if remaining > self.FRAME_SPIN_TIME:
+            time.sleep(remaining - self.FRAME_SPIN_TIME)
+        
+        while time.perf_counter() - frame_start < target:
+            pass
+    
     def handle_events(self) -> None:
         """
         Handle all pygame events.
-        Processes quit events and passes events to scene manager.
+        Pumps the queue once, drains the filtered events in a single batch,
+        processes quit/key events and passes every event to the scene manager.
         """
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        pygame.event.pump()
+        events = pygame.event.get(self._EVENT_FILTER, pump=False)
+        if not events:
+            return
+        
+        scene_handle_event = self.scene_manager.handle_event if self.scene_manager else None
+        
+        for event in events:
+            event_type = event.type
+            if event_type == pygame.QUIT:
                 self.running = False
             
-            elif event.type == pygame.KEYDOWN:
+            elif event_type == pygame.KEYDOWN:
                 self._handle_keydown(event)
             
-            elif event.type == pygame.KEYUP:
+            elif event_type == pygame.KEYUP:
                 self._handle_keyup(event)
             
             # Pass event to scene manager
-            if self.scene_manager:
-                self.scene_manager.handle_event(event)
+            if scene_handle_event:
+                scene_handle_event(event)
     
     def _handle_keydown(self, event: pygame.event.Event) -> None:
         """
@@ -176,14 +283,15 @@ class Game:
         Args:
             event: Pygame keydown event
         """
-        if event.key == pygame.K_ESCAPE:
-            self.running = False
-        
-        # Debug information toggle
-        elif event.key == pygame.K_F1:
-            debug_mode = self.config.get("game", {}).get("debug_mode", False)
-            self.config["game"]["debug_mode"] = not debug_mode
-            print(f"Debug mode: {'ON' if not debug_mode else 'OFF'}")
+        handler = self._keydown_handlers.get(event.key)
+        if handler is not None:
+            handler()
+    
+    def _toggle_debug(self) -> None:
+        """Toggle debug information display and keep the config in sync."""
+        self.debug_mode = not self.debug_mode
+        self.config.setdefault("game", {})["debug_mode"] = self.debug_mode
+        print(f"Debug mode: {'ON' if self.debug_mode else 'OFF'}")
     
     def _handle_keyup(self, event: pygame.event.Event) -> None:
         """
@@ -208,65 +316,114 @@ class Game:
     
     def render(self) -> None:
         """Render the game to the screen."""
-        # Clear screen with black background
-        self.screen.fill((0, 0, 0))
-        
         # Render current scene
         if self.scene_manager and self.scene_manager.has_scenes():
+            # Opaque scenes overwrite every pixel, so clearing would be wasted work
+            if self._needs_clear:
+                self.screen.fill((0, 0, 0))
             self.scene_manager.render(self.screen)
         else:
-            # Render placeholder if no scene is active
+            # Clear screen with black background and render placeholder
+            self.screen.fill((0, 0, 0))
             self._render_placeholder()
         
         # Render debug information if enabled
-        if self.config.get("game", {}).get("debug_mode", False):
+        if self.debug_mode:
             self._render_debug_info()
         
         # Update display
         pygame.display.flip()
     
+    def _get_font(self, size: int) -> pygame.font.Font:
+        """
+        Get the default font at the given size, using cache for performance.
+        
+        Args:
+            size: Font size
+            
+        Returns:
+            Pygame font object
+        """
+        font = self.font_cache.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self.font_cache[size] = font
+        return font
+    
+    def _render_static_text(self, text: str, size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Render text that never changes, caching the resulting surface.
+        
+        Args:
+            text: Text to render
+            size: Font size
+            color: Text color
+            
+        Returns:
+            Rendered text surface
+        """
+        cache_key = (text, size, color)
+        surface = self.text_cache.get(cache_key)
+        if surface is None:
+            surface = self._get_font(size).render(text, True, color)
+            self.text_cache[cache_key] = surface
+        return surface
+    
     def _render_debug_info(self) -> None:
         """Render debug information on screen."""
         try:
-            font = pygame.font.Font(None, 24)
-            
             # FPS information
-            fps = self.clock.get_fps()
-            fps_text = font.render(f"FPS: {fps:.1f}", True, (255, 255, 255))
-            self.screen.blit(fps_text, (10, 10))
+            fps = round(self.clock.get_fps())
+            self._render_debug_line("FPS: ", str(fps), 10)
             
             # Delta time information
-            dt_text = font.render(f"Delta Time: {self.delta_time:.4f}s", True, (255, 255, 255))
-            self.screen.blit(dt_text, (10, 35))
+            self._render_debug_line("Delta Time: ", f"{self.delta_time:.4f}s", 35)
             
             # Resource cache info
             if self.resource_manager:
                 cache_info = self.resource_manager.get_cache_info()
-                cache_text = font.render(f"Cache: {cache_info}", True, (255, 255, 255))
-                self.screen.blit(cache_text, (10, 60))
+                self._render_debug_line("Cache: ", str(cache_info), 60)
             
             # Scene info
             if self.scene_manager:
                 scene_count = self.scene_manager.get_scene_count()
                 current_scene = self.scene_manager.get_current_scene()
                 scene_name = current_scene.get_name() if current_scene else "None"
-                scene_text = font.render(f"Scene: {scene_name} ({scene_count} total)", True, (255, 255, 255))
-                self.screen.blit(scene_text, (10, 85))
+                self._render_debug_line("Scene: ", f"{scene_name} ({scene_count} total)", 85)
             
         except pygame.error:
             # If font rendering fails, just skip debug info
             pass
     
+    def _render_debug_line(self, label: str, value: str, y: int) -> None:
+        """
+        Render one debug HUD line as a cached label followed by its value.
+        The value surface is only re-rendered when its text changes.
+        
+        Args:
+            label: Static label text
+            value: Current value text
+            y: Vertical screen position of the line
+        """
+        label_surface = self._render_static_text(label, 24, (255, 255, 255))
+        self.screen.blit(label_surface, (10, y))
+        
+        cached = self.hud_value_cache.get(label)
+        if cached is None or cached[0] != value:
+            value_surface = self._get_font(24).render(value, True, (255, 255, 255))
+            self.hud_value_cache[label] = (value, value_surface)
+        else:
+            value_surface = cached[1]
+        self.screen.blit(value_surface, (10 + label_surface.get_width(), y))
+    
     def _render_placeholder(self) -> None:
         """Render placeholder content while game systems are being developed."""
         try:
-            font = pygame.font.Font(None, 48)
-            title_text = font.render("Zelda-like 2D Game", True, (255, 255, 255))
+            title_text = self._render_static_text("Zelda-like 2D Game", 48, (255, 255, 255))
             title_rect = title_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 - 50))
             self.screen.blit(title_text, title_rect)
             
-            font_small = pygame.font.Font(None, 24)
-            instruction_text = font_small.render("Press ESC to quit, F1 for debug info", True, (200, 200, 200))
+            instruction_text = self._render_static_text("Press ESC to quit, F1 for debug info", 24, (200, 200, 200))
             instruction_rect = instruction_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 20))
             self.screen.blit(instruction_text, instruction_rect)
             
@@ -282,6 +439,11 @@ class Game:
         if self.scene_manager:
             self.scene_manager.cleanup()
         
+        # Drop cached fonts and text before pygame shuts down
+        self.font_cache.clear()
+        self.text_cache.clear()
+        self.hud_value_cache.clear()
+        
         # Clear resource caches
         if self.resource_manager:
             self.resource_manager.clear_cache()
@@ -326,6 +488,16 @@ class Game:
         """
         return self.running
     
+    def set_opaque(self, opaque: bool) -> None:
+        """
+        Declare whether the active scenes cover the whole screen every frame.
+        When opaque, the per-frame screen clear is skipped.
+        
+        Args:
+            opaque: True if scenes fully redraw the screen each frame
+        """
+        self._needs_clear = not opaque
+    
     def quit(self) -> None:
         """Request the game to quit gracefully."""
         self.running = False
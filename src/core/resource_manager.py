@@ -4,10 +4,41 @@ Handles images, sounds, and map data with error handling and caching.
 """
 import pygame
 import json
+import logging
 import os
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Set
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    # orjson is optional; fall back to the standard library parser
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Image cache sub-keys for the two non-color colorkey values
+NO_COLORKEY = -1
+AUTO_COLORKEY = -2
+
+
+def _pack_colorkey(colorkey: Any) -> int:
+    """
+    Pack a colorkey into a single int usable as an image cache sub-key.
+    
+    Args:
+        colorkey: None, "auto", or an RGB(A) color sequence
+        
+    Returns:
+        NO_COLORKEY, AUTO_COLORKEY, or the color packed as 0xRRGGBB
+    """
+    if not colorkey:
+        return NO_COLORKEY
+    if colorkey == "auto":
+        return AUTO_COLORKEY
+    return (colorkey[0] << 16) | (colorkey[1] << 8) | colorkey[2]
+
 
 class ResourceLoadError(Exception):
     """Exception raised when resource loading fails."""
@@ -20,6 +51,12 @@ class ResourceManager:
     Provides error handling with fallback to default resources when loading fails.
     """
     
+    __slots__ = (
+        'assets_path', '_images_dir', '_sounds_dir', '_maps_dir',
+        'image_cache', 'sound_cache', 'map_cache', 'default_image',
+        '_missing_images',
+    )
+    
     def __init__(self, assets_path: str = "assets"):
         """
         Initialize the ResourceManager.
@@ -28,10 +65,19 @@ class ResourceManager:
             assets_path: Base path to the assets directory
         """
         self.assets_path = Path(assets_path)
-        self.image_cache: Dict[str, pygame.Surface] = {}
+        
+        # Resource directories as plain strings, so loads avoid Path allocations
+        self._images_dir = str(self.assets_path / "images")
+        self._sounds_dir = str(self.assets_path / "sounds")
+        self._maps_dir = str(self.assets_path / "maps")
+        # Images are cached by path, then by packed colorkey (see _pack_colorkey)
+        self.image_cache: Dict[str, Dict[int, pygame.Surface]] = {}
         self.sound_cache: Dict[str, pygame.mixer.Sound] = {}
         self.map_cache: Dict[str, Dict[str, Any]] = {}
         
+        # Image paths that failed to load; they resolve to the shared default image
+        self._missing_images: Set[str] = set()
+        
         # Create default resources
         self._create_default_resources()
     
@@ -42,7 +88,7 @@ class ResourceManager:
         self.default_image.fill((255, 0, 255))  # Magenta/pink color
         
         # Store default image in cache
-        self.image_cache["__default__"] = self.default_image
+        self.image_cache["__default__"] = {NO_COLORKEY: self.default_image}
     
     def load_image(self, path: str, colorkey: Optional[tuple] = None) -> pygame.Surface:
         """
@@ -56,40 +102,73 @@ class ResourceManager:
             pygame.Surface: Loaded image or default image if loading fails
         """
         # Check cache first
-        cache_key = f"{path}_{colorkey}" if colorkey else path
-        if cache_key in self.image_cache:
-            return self.image_cache[cache_key]
+        cache_key = _pack_colorkey(colorkey)
+        cache_bucket = self.image_cache.get(path)
+        if cache_bucket is not None:
+            cached_image = cache_bucket.get(cache_key)
+            if cached_image is not None:
+                return cached_image
+        else:
+            cache_bucket = self.image_cache[path] = {}
+        
+        # Known-missing images map straight to the shared default image
+        if path in self._missing_images:
+            cache_bucket[cache_key] = self.default_image
+            return self.default_image
         
         # Try to load the image
-        full_path = self.assets_path / "images" / path
+        full_path = os.path.join(self._images_dir, path)
         
         try:
-            if not full_path.exists():
+            if not os.path.isfile(full_path):
                 raise ResourceLoadError(f"Image file not found: {full_path}")
             
-            image = pygame.image.load(str(full_path)).convert()
+            raw_image = pygame.image.load(full_path)
             
+            # Convert exactly once to the display format
             if colorkey:
+                image = raw_image.convert()
                 if colorkey == "auto":
                     # Use top-left pixel as colorkey
                     colorkey = image.get_at((0, 0))
-                image.set_colorkey(colorkey)
+                # RLE-accelerated blits for colorkeyed sprites
+                image.set_colorkey(colorkey, pygame.RLEACCEL)
             else:
                 # Convert with alpha for transparency support
-                image = image.convert_alpha()
+                image = raw_image.convert_alpha()
             
             # Cache the loaded image
-            self.image_cache[cache_key] = image
+            cache_bucket[cache_key] = image
             return image
             
         except (pygame.error, ResourceLoadError, OSError) as e:
-            print(f"Warning: Failed to load image '{path}': {e}")
-            print(f"Using default image instead.")
+            # Report each missing image only once
+            if path not in self._missing_images:
+                self._missing_images.add(path)
+                logger.warning("Failed to load image '%s': %s. Using default image instead.", path, e)
             
             # Return default image and cache it with this path
-            self.image_cache[cache_key] = self.default_image
+            cache_bucket[cache_key] = self.default_image
             return self.default_image
     
+    def ensure_audio(self) -> bool:
+        """
+        Initialize the audio mixer if it is not already running.
+        Called lazily by load_sound; call it explicitly to open audio up front.
+        
+        Returns:
+            True if the mixer is available, False otherwise
+        """
+        if pygame.mixer.get_init():
+            return True
+        
+        try:
+            pygame.mixer.init()
+            return True
+        except pygame.error as e:
+            logger.warning("Failed to initialize audio mixer: %s", e)
+            return False
+    
     def load_sound(self, path: str) -> Optional[pygame.mixer.Sound]:
         """
         Load a sound from file with caching and error handling.
@@ -104,21 +183,26 @@ class ResourceManager:
         if path in self.sound_cache:
             return self.sound_cache[path]
         
+        # Open the audio device on first use; without it no sound can load
+        if not self.ensure_audio():
+            self.sound_cache[path] = None
+            return None
+        
         # Try to load the sound
-        full_path = self.assets_path / "sounds" / path
+        full_path = os.path.join(self._sounds_dir, path)
         
         try:
-            if not full_path.exists():
+            if not os.path.isfile(full_path):
                 raise ResourceLoadError(f"Sound file not found: {full_path}")
             
-            sound = pygame.mixer.Sound(str(full_path))
+            sound = pygame.mixer.Sound(full_path)
             
             # Cache the loaded sound
             self.sound_cache[path] = sound
             return sound
             
         except (pygame.error, ResourceLoadError, OSError) as e:
-            print(f"Warning: Failed to load sound '{path}': {e}")
+            logger.warning("Failed to load sound '%s': %s", path, e)
             
             # Cache None to avoid repeated loading attempts
             self.sound_cache[path] = None
@@ -139,14 +223,14 @@ class ResourceManager:
             return self.map_cache[path]
         
         # Try to load the map
-        full_path = self.assets_path / "maps" / path
+        full_path = os.path.join(self._maps_dir, path)
         
         try:
-            if not full_path.exists():
+            if not os.path.isfile(full_path):
                 raise ResourceLoadError(f"Map file not found: {full_path}")
             
-            with open(full_path, 'r', encoding='utf-8') as f:
-                map_data = json.load(f)
+            with open(full_path, 'rb') as f:
+                map_data = _json_loads(f.read())
             
             # Validate basic map structure
             required_keys = ['width', 'height', 'tile_size']
@@ -159,17 +243,17 @@ class ResourceManager:
             return map_data
             
         except (json.JSONDecodeError, ResourceLoadError, OSError) as e:
-            print(f"Warning: Failed to load map '{path}': {e}")
-            print("Using default empty map instead.")
+            logger.warning("Failed to load map '%s': %s. Using default empty map instead.", path, e)
             
-            # Return default empty map
+            # Return default empty map (rows built with C-level list repetition)
+            width, height = 10, 10
             default_map = {
-                "width": 10,
-                "height": 10,
+                "width": width,
+                "height": height,
                 "tile_size": 32,
                 "layers": {
-                    "background": [[0 for _ in range(10)] for _ in range(10)],
-                    "collision": [[0 for _ in range(10)] for _ in range(10)],
+                    "background": [[0] * width for _ in range(height)],
+                    "collision": [[0] * width for _ in range(height)],
                     "objects": []
                 }
             }
@@ -214,9 +298,9 @@ class ResourceManager:
             if resource_type and path:
                 try:
                     self.get_resource(resource_type, path, **kwargs)
-                    print(f"Preloaded {resource_type}: {path}")
+                    logger.debug("Preloaded %s: %s", resource_type, path)
                 except Exception as e:
-                    print(f"Failed to preload {resource_type} '{path}': {e}")
+                    logger.warning("Failed to preload %s '%s': %s", resource_type, path, e)
     
     def clear_cache(self, resource_type: Optional[str] = None) -> None:
         """
@@ -229,6 +313,7 @@ class ResourceManager:
             # Keep default image
             default_img = self.image_cache.get("__default__")
             self.image_cache.clear()
+            self._missing_images.clear()
             if default_img:
                 self.image_cache["__default__"] = default_img
         
@@ -246,7 +331,7 @@ class ResourceManager:
             Dict with cache sizes for each resource type
         """
         return {
-            "images": len(self.image_cache),
+            "images": sum(len(bucket) for bucket in self.image_cache.values()),
             "sounds": len(self.sound_cache),
             "maps": len(self.map_cache)
         }
\ No newline at end of file
@@ -2,7 +2,7 @@
 Sprite loader utility for loading game object sprites from image files.
 """
 import pygame
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple, Hashable
 from src.core.resource_manager import ResourceManager
 
 
@@ -12,6 +12,10 @@ class SpriteLoader:
     Provides fallback to programmatic sprite creation if images are not found.
     """
     
+    __slots__ = (
+        'resource_manager', 'sprite_map', 'atlas_sizes', '_sprite_cache',
+    )
+    
     def __init__(self, resource_manager: ResourceManager):
         """
         Initialize the sprite loader.
@@ -33,6 +37,99 @@ class SpriteLoader:
             'leather_armor': 'sword.png',  # Reuse sword for now
             'speed_boots': 'sword.png',  # Reuse sword for now
         }
+        
+        # Sprite sizes used by the game objects, packed into the atlas
+        self.atlas_sizes = {
+            'player': (32, 32),
+            'goblin': (32, 32),
+            'orc': (32, 32),
+            'health_potion': (24, 24),
+            'mana_potion': (24, 24),
+            'iron_sword': (24, 24),
+            'sword': (24, 24),
+            'leather_armor': (24, 24),
+            'speed_boots': (24, 24),
+        }
+        
+        # Scaled and fallback sprites, shared by every entity of the same type/size
+        self._sprite_cache: Dict[Tuple[Hashable, ...], pygame.Surface] = {}
+    
+    def _load_scaled_sprite(self, sprite_path: Optional[str], width: int, height: int) -> Optional[pygame.Surface]:
+        """
+        Load an image and scale it to the requested size, caching the result.
+        
+        Args:
+            sprite_path: Image path relative to assets/images/, or None
+            width: Desired sprite width
+            height: Desired sprite height
+            
+        Returns:
+            Scaled sprite surface, or None if there is no image for the path
+        """
+        if not sprite_path:
+            return None
+        
+        cache_key = (sprite_path, width, height)
+        sprite = self._sprite_cache.get(cache_key)
+        if sprite is not None:
+            return sprite
+        
+        sprite = self.resource_manager.load_image(sprite_path)
+        if sprite and (sprite.get_width() != width or sprite.get_height() != height):
+            sprite = pygame.transform.scale(sprite, (width, height))
+        if sprite:
+            self._sprite_cache[cache_key] = sprite
+        return sprite
+    
+    def build_atlas(self, atlas_width: int = 256) -> Optional[pygame.Surface]:
+        """
+        Pack all mapped sprites into a single atlas surface.
+        Sprites are laid out on shelves (rows) and the cached sprites are
+        replaced by subsurfaces of the atlas, so subsequent load_* calls
+        return views into one contiguous block of pixels. The subsurfaces
+        keep the atlas alive; no separate reference is stored.
+        
+        Args:
+            atlas_width: Width of the atlas in pixels
+            
+        Returns:
+            The atlas surface, or None if there was nothing to pack
+        """
+        # Collect unique (path, size) entries; several names share one image
+        entries: Dict[Tuple[str, int, int], pygame.Surface] = {}
+        for name, (width, height) in self.atlas_sizes.items():
+            sprite_path = self.sprite_map.get(name)
+            sprite = self._load_scaled_sprite(sprite_path, width, height)
+            if not sprite:
+                continue
+            entries[(sprite_path, width, height)] = sprite
+        
+        if not entries:
+            return None
+        
+        # Shelf packing: tallest sprites first, wrap to a new row when full
+        rects: Dict[Tuple[str, int, int], pygame.Rect] = {}
+        cursor_x, cursor_y, row_height = 0, 0, 0
+        for cache_key in sorted(entries, key=lambda key: key[2], reverse=True):
+            _, width, height = cache_key
+            if cursor_x + width > atlas_width:
+                cursor_x = 0
+                cursor_y += row_height
+                row_height = 0
+            rects[cache_key] = pygame.Rect(cursor_x, cursor_y, width, height)
+            cursor_x += width
+            row_height = max(row_height, height)
+        
+        atlas = pygame.Surface((atlas_width, cursor_y + row_height), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+        atlas.fill((0, 0, 0, 0))
+        
+        for cache_key, rect in rects.items():
+            atlas.blit(entries[cache_key], rect)
+            self._sprite_cache[cache_key] = atlas.subsurface(rect)
+        
+        return atlas
     
     def load_player_sprite(self, width: int = 32, height: int = 32) -> pygame.Surface:
         """
@@ -45,16 +142,17 @@ class SpriteLoader:
         Returns:
             Pygame surface with player sprite
         """
-        sprite_path = self.sprite_map.get('player')
-        if sprite_path:
-            sprite = self.resource_manager.load_image(sprite_path)
-            if sprite and (sprite.get_width() != width or sprite.get_height() != height):
-                sprite = pygame.transform.scale(sprite, (width, height))
-            if sprite:
-                return sprite
+        sprite = self._load_scaled_sprite(self.sprite_map.get('player'), width, height)
+        if sprite:
+            return sprite
         
         # Fallback to programmatic sprite
-        return self._create_fallback_player_sprite(width, height)
+        cache_key = ('__fallback_player__', width, height)
+        sprite = self._sprite_cache.get(cache_key)
+        if sprite is None:
+            sprite = self._create_fallback_player_sprite(width, height)
+            self._sprite_cache[cache_key] = sprite
+        return sprite
     
     def load_enemy_sprite(self, enemy_type: str, width: int = 32, height: int = 32) -> pygame.Surface:
         """
@@ -68,16 +166,17 @@ class SpriteLoader:
         Returns:
             Pygame surface with enemy sprite
         """
-        sprite_path = self.sprite_map.get(enemy_type)
-        if sprite_path:
-            sprite = self.resource_manager.load_image(sprite_path)
-            if sprite and (sprite.get_width() != width or sprite.get_height() != height):
-                sprite = pygame.transform.scale(sprite, (width, height))
-            if sprite:
-                return sprite
+        sprite = self._load_scaled_sprite(self.sprite_map.get(enemy_type), width, height)
+        if sprite:
+            return sprite
         
         # Fallback to programmatic sprite
-        return self._create_fallback_enemy_sprite(enemy_type, width, height)
+        cache_key = ('__fallback_enemy__', enemy_type, width, height)
+        sprite = self._sprite_cache.get(cache_key)
+        if sprite is None:
+            sprite = self._create_fallback_enemy_sprite(enemy_type, width, height)
+            self._sprite_cache[cache_key] = sprite
+        return sprite
     
     def load_item_sprite(self, item_type: str, width: int = 24, height: int = 24) -> pygame.Surface:
         """
@@ -91,16 +190,17 @@ class SpriteLoader:
         Returns:
             Pygame surface with item sprite
         """
-        sprite_path = self.sprite_map.get(item_type)
-        if sprite_path:
-            sprite = self.resource_manager.load_image(sprite_path)
-            if sprite and (sprite.get_width() != width or sprite.get_height() != height):
-                sprite = pygame.transform.scale(sprite, (width, height))
-            if sprite:
-                return sprite
+        sprite = self._load_scaled_sprite(self.sprite_map.get(item_type), width, height)
+        if sprite:
+            return sprite
         
         # Fallback to programmatic sprite
-        return self._create_fallback_item_sprite(item_type, width, height)
+        cache_key = ('__fallback_item__', item_type, width, height)
+        sprite = self._sprite_cache.get(cache_key)
+        if sprite is None:
+            sprite = self._create_fallback_item_sprite(item_type, width, height)
+            self._sprite_cache[cache_key] = sprite
+        return sprite
     
     def _create_fallback_player_sprite(self, width: int, height: int) -> pygame.Surface:
         """Create fallback player sprite programmatically."""
@@ -135,6 +235,9 @@ class SpriteLoader:
         pygame.draw.circle(sprite, (255, 0, 0), (24, 8), 3)
         pygame.draw.rect(sprite, (255, 255, 255), (12, 20, 8, 4))  # Teeth
         
+        # Match the display format so blits take SDL's fast path
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
         return sprite
     
     def _create_fallback_item_sprite(self, item_type: str, width: int, height: int) -> pygame.Surface:
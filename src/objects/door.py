@@ -1,16 +1,53 @@
 """
 Door class for stage transitions and locked areas.
 """
+import logging
+import math
 import pygame
-from typing import Tuple, Optional
+from array import array
+from typing import Dict, Tuple, Optional
 from .game_object import GameObject
 
+logger = logging.getLogger(__name__)
+
+
+# Sine lookup table for glow animation, indexed by phase * _SIN_TABLE_SCALE
+_SIN_TABLE_SIZE = 1024
+_SIN_TABLE_SCALE = _SIN_TABLE_SIZE / (2 * math.pi)
+_SIN_TABLE = array('f', [math.sin(i * 2 * math.pi / _SIN_TABLE_SIZE) for i in range(_SIN_TABLE_SIZE)])
+
+
+def _panel_color(color: Tuple[int, int, int]) -> Tuple[int, int, int]:
+    """Darken a door color by 20 per channel for the door panels."""
+    return (max(0, color[0] - 20), max(0, color[1] - 20), max(0, color[2] - 20))
+
 
 class Door(GameObject):
     """
     Door object that can be locked/unlocked and provides stage transitions.
     """
     
+    # Door colors
+    LOCKED_COLOR = (139, 69, 19)    # Brown - locked door
+    UNLOCKED_COLOR = (34, 139, 34)  # Green - unlocked door
+    OPEN_COLOR = (255, 215, 0)      # Gold - open door
+    
+    # Precomputed panel shades for the closed door colors
+    _DARK_LOCKED = _panel_color(LOCKED_COLOR)
+    _DARK_UNLOCKED = _panel_color(UNLOCKED_COLOR)
+    
+    # Handle colors indexed by is_locked
+    _HANDLE_COLORS = ((255, 255, 255), (100, 100, 100))
+    
+    # Sprites shared by all doors, keyed by (width, height, state, color)
+    _sprite_cache: Dict[Tuple, pygame.Surface] = {}
+    
+    # Pre-rendered "E" interaction indicator, shared by all doors
+    _indicator_surface: Optional[pygame.Surface] = None
+    
+    # Solid glow surfaces, keyed by (width, height, color); alpha is set per frame
+    _glow_cache: Dict[Tuple, pygame.Surface] = {}
+    
     def __init__(self, x: float, y: float, door_id: str, 
                  target_map: str = None, target_position: Tuple[float, float] = None,
                  width: float = 32, height: float = 32):
@@ -38,9 +75,9 @@ class Door(GameObject):
         self.unlock_condition = "clear_enemies"  # Condition to unlock
         
         # Visual properties
-        self.locked_color = (139, 69, 19)    # Brown - locked door
-        self.unlocked_color = (34, 139, 34)  # Green - unlocked door
-        self.open_color = (255, 215, 0)      # Gold - open door
+        self.locked_color = self.LOCKED_COLOR
+        self.unlocked_color = self.UNLOCKED_COLOR
+        self.open_color = self.OPEN_COLOR
         
         # Animation properties
         self.glow_time = 0.0
@@ -53,48 +90,112 @@ class Door(GameObject):
         self.interaction_radius = 40  # Pixels - how close player needs to be
         self.can_interact = False
         
+        # Precomputed values for the per-frame interaction check; doors are
+        # stationary, so the world-space center only changes in set_position
+        self._interaction_radius_sq = self.interaction_radius * self.interaction_radius
+        self._cx = x + width * 0.5
+        self._cy = y + height * 0.5
+        self._half_w_int = int(width) // 2
+        
+        # Cached get_info() snapshot, built on first request
+        self._info: Optional[dict] = None
+        
+        # State index ((is_open << 1) | is_locked) the current sprite was selected for
+        self._visual_state: Optional[int] = None
+        
         # Create sprite
         self._create_sprite()
     
     def _create_sprite(self) -> None:
-        """Create the visual sprite for this door."""
-        self.sprite = pygame.Surface((self.width, self.height))
+        """Create the visual sprites for every door state and select the current one."""
+        # Cache keys indexed by (is_open << 1) | is_locked
+        self._state_keys = (
+            (self.width, self.height, "unlocked", self.unlocked_color),
+            (self.width, self.height, "locked", self.locked_color),
+            (self.width, self.height, "open", self.open_color),
+            (self.width, self.height, "open", self.open_color),
+        )
+        for is_locked, is_open in ((True, False), (False, False), (False, True)):
+            cache_key = self._sprite_cache_key(is_locked, is_open)
+            if cache_key not in Door._sprite_cache:
+                Door._sprite_cache[cache_key] = self._build_state_sprite(is_locked, is_open)
         self._update_sprite()
     
-    def _update_sprite(self) -> None:
-        """Update sprite based on current door state."""
-        if self.is_open:
-            color = self.open_color
-        elif self.is_locked:
-            color = self.locked_color
-        else:
-            color = self.unlocked_color
+    def _sprite_cache_key(self, is_locked: bool, is_open: bool) -> Tuple:
+        """
+        Get the shared sprite cache key for a door state.
         
-        self.sprite.fill(color)
+        Args:
+            is_locked: Whether the door is locked
+            is_open: Whether the door is open
+            
+        Returns:
+            Tuple of (width, height, state, color)
+        """
+        return self._state_keys[(is_open << 1) | is_locked]
+    
+    def _build_state_sprite(self, is_locked: bool, is_open: bool) -> pygame.Surface:
+        """
+        Draw the sprite for one door state.
+        
+        Args:
+            is_locked: Whether the door is locked
+            is_open: Whether the door is open
+            
+        Returns:
+            Pygame surface with the door drawn in the given state
+        """
+        color = self._sprite_cache_key(is_locked, is_open)[3]
+        sprite = pygame.Surface((self.width, self.height))
+        sprite.fill(color)
         
         # Add door details
-        if self.is_open:
+        if is_open:
             # Open door - show opening
-            pygame.draw.rect(self.sprite, (0, 0, 0), (8, 4, 16, 24))  # Opening
-            pygame.draw.rect(self.sprite, color, (2, 0, 6, 32))       # Left frame
-            pygame.draw.rect(self.sprite, color, (24, 0, 6, 32))      # Right frame
+            pygame.draw.rect(sprite, (0, 0, 0), (8, 4, 16, 24))  # Opening
+            pygame.draw.rect(sprite, color, (2, 0, 6, 32))       # Left frame
+            pygame.draw.rect(sprite, color, (24, 0, 6, 32))      # Right frame
         else:
             # Closed door
-            pygame.draw.rect(self.sprite, color, (0, 0, self.width, self.height))
+            pygame.draw.rect(sprite, color, (0, 0, self.width, self.height))
             
             # Door handle
-            handle_color = (255, 255, 255) if not self.is_locked else (100, 100, 100)
-            pygame.draw.circle(self.sprite, handle_color, (int(self.width * 0.8), int(self.height // 2)), 3)
+            handle_color = self._HANDLE_COLORS[is_locked]
+            pygame.draw.circle(sprite, handle_color, (int(self.width * 0.8), int(self.height // 2)), 3)
             
             # Lock indicator
-            if self.is_locked:
+            if is_locked:
                 # Draw lock symbol
-                pygame.draw.rect(self.sprite, (50, 50, 50), (12, 10, 8, 6))  # Lock body
-                pygame.draw.circle(self.sprite, (50, 50, 50), (16, 8), 3, 2)  # Lock shackle
+                pygame.draw.rect(sprite, (50, 50, 50), (12, 10, 8, 6))  # Lock body
+                pygame.draw.circle(sprite, (50, 50, 50), (16, 8), 3, 2)  # Lock shackle
             
             # Door panels
-            pygame.draw.rect(self.sprite, tuple(max(0, c - 20) for c in color), (4, 4, self.width - 8, 10))
-            pygame.draw.rect(self.sprite, tuple(max(0, c - 20) for c in color), (4, 18, self.width - 8, 10))
+            if color == self.LOCKED_COLOR:
+                dark_color = self._DARK_LOCKED
+            elif color == self.UNLOCKED_COLOR:
+                dark_color = self._DARK_UNLOCKED
+            else:
+                dark_color = _panel_color(color)
+            pygame.draw.rect(sprite, dark_color, (4, 4, self.width - 8, 10))
+            pygame.draw.rect(sprite, dark_color, (4, 18, self.width - 8, 10))
+        
+        # Match the display format so blits take SDL's fast path
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+        return sprite
+    
+    def _update_sprite(self) -> None:
+        """Update sprite based on current door state."""
+        visual_state = (self.is_open << 1) | self.is_locked
+        if visual_state == self._visual_state:
+            return
+        self._visual_state = visual_state
+        
+        cache_key = self._state_keys[visual_state]
+        sprite = Door._sprite_cache.get(cache_key)
+        if sprite is None:
+            sprite = Door._sprite_cache[cache_key] = self._build_state_sprite(self.is_locked, self.is_open)
+        self.sprite = sprite
     
     def update(self, dt: float, player_position: Optional[Tuple[float, float]] = None) -> None:
         """
@@ -104,6 +205,20 @@ class Door(GameObject):
             dt: Delta time since last frame in seconds
             player_position: Current player position for interaction checks
         """
+        if player_position:
+            self._step(dt, player_position[0], player_position[1])
+        else:
+            self._step(dt, None, None)
+    
+    def _step(self, dt: float, player_x: Optional[float], player_y: Optional[float]) -> None:
+        """
+        Advance one door by one frame; shared by update() and update_batch().
+        
+        Args:
+            dt: Delta time since last frame in seconds
+            player_x: Player x position, or None to skip the interaction check
+            player_y: Player y position, or None to skip the interaction check
+        """
         # Update glow animation
         self.glow_time += dt * self.glow_speed
         
@@ -115,21 +230,40 @@ class Door(GameObject):
                 self.unlock_animation_time = 0.0
                 self._update_sprite()
         
-        # Check player interaction
+        # Check player interaction (squared distance, no sqrt)
+        if player_x is not None:
+            dx = player_x - self._cx
+            dy = player_y - self._cy
+            self.can_interact = (dx * dx + dy * dy) <= self._interaction_radius_sq and not self.is_locked
+    
+    @classmethod
+    def update_batch(cls, doors: list, dt: float,
+                     player_position: Optional[Tuple[float, float]] = None) -> None:
+        """
+        Update a group of doors in one pass.
+        Equivalent to calling update() on each door, with the player position
+        unpacked once for the whole group.
+        
+        Args:
+            doors: Doors to update
+            dt: Delta time since last frame in seconds
+            player_position: Current player position for interaction checks
+        """
         if player_position:
-            distance = pygame.math.Vector2(
-                player_position[0] - (self.x + self.width / 2),
-                player_position[1] - (self.y + self.height / 2)
-            ).length()
-            
-            self.can_interact = distance <= self.interaction_radius and not self.is_locked
+            player_x, player_y = player_position
+        else:
+            player_x = player_y = None
+        
+        for door in doors:
+            door._step(dt, player_x, player_y)
     
     def unlock(self) -> None:
         """Unlock the door with animation."""
         if not self.is_locked:
             return
         
-        print(f"Door {self.door_id} is unlocking!")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Door %s is unlocking", self.door_id)
         self.is_locked = False
         self.is_unlocking = True
         self.unlock_animation_time = 0.0
@@ -140,13 +274,15 @@ class Door(GameObject):
         if self.is_locked:
             return
         
-        print(f"Door {self.door_id} is opening!")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Door %s is opening", self.door_id)
         self.is_open = True
         self._update_sprite()
     
     def close(self) -> None:
         """Close the door."""
-        print(f"Door {self.door_id} is closing!")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Door %s is closing", self.door_id)
         self.is_open = False
         self._update_sprite()
     
@@ -173,7 +309,8 @@ class Door(GameObject):
             return False
         
         if self.is_locked:
-            print(f"Door {self.door_id} is locked!")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Door %s is locked", self.door_id)
             return False
         
         if not self.is_open:
@@ -222,6 +359,63 @@ class Door(GameObject):
             if self.can_interact:
                 self._render_interaction_indicator(screen, screen_x, screen_y)
     
+    @classmethod
+    def render_batch(cls, doors: list, screen: pygame.Surface,
+                     camera_x: float = 0, camera_y: float = 0) -> None:
+        """
+        Render a group of doors with batched blits.
+        Glow effects are blitted per door since each needs its own alpha;
+        sprites and interaction indicators are collected and drawn with a
+        single Surface.blits call.
+        
+        Args:
+            doors: Doors to render
+            screen: Pygame surface to render to
+            camera_x: Camera X offset
+            camera_y: Camera Y offset
+        """
+        clip = screen.get_clip()
+        clip_left, clip_top, clip_right, clip_bottom = clip.left, clip.top, clip.right, clip.bottom
+        
+        sprite_blits = []
+        indicator_doors = []
+        for door in doors:
+            if not door.active:
+                continue
+            
+            # Convert world coordinates to screen coordinates
+            screen_x = int(door.x - camera_x)
+            screen_y = int(door.y - camera_y)
+            
+            # Skip doors outside the clip area
+            if (screen_x + door.width < clip_left or screen_x >= clip_right or
+                screen_y + door.height < clip_top or screen_y >= clip_bottom):
+                continue
+            
+            # Render glow effect for unlocked/unlocking doors
+            if not door.is_locked or door.is_unlocking:
+                door._render_glow_effect(screen, screen_x, screen_y)
+            
+            sprite_blits.append((door.sprite, (screen_x, screen_y)))
+            if door.can_interact:
+                indicator_doors.append((door, screen_x, screen_y))
+        
+        if indicator_doors:
+            try:
+                indicator = cls._get_indicator_surface()
+                for door, screen_x, screen_y in indicator_doors:
+                    sprite_blits.append((indicator, (screen_x + door._half_w_int - 12, screen_y - 32)))
+                indicator_doors = []
+            except pygame.error:
+                # Font failed; indicators fall back to per-door drawing below
+                pass
+        
+        if sprite_blits:
+            screen.blits(sprite_blits, doreturn=False)
+        
+        for door, screen_x, screen_y in indicator_doors:
+            door._render_interaction_indicator(screen, screen_x, screen_y)
+    
     def _render_glow_effect(self, screen: pygame.Surface, screen_x: int, screen_y: int) -> None:
         """
         Render glow effect for unlocked doors.
@@ -231,28 +425,47 @@ class Door(GameObject):
             screen_x: Screen X position
             screen_y: Screen Y position
         """
-        import math
-        
         # Calculate glow intensity
         if self.is_unlocking:
-            # Pulsing glow during unlock animation
+            # Pulsing glow during unlock animation (four full pulses)
             progress = self.unlock_animation_time / self.unlock_animation_duration
-            intensity = int(100 * (1.0 + math.sin(progress * math.pi * 8)) / 2)
+            phase = int(progress * 4 * _SIN_TABLE_SIZE) & (_SIN_TABLE_SIZE - 1)
+            intensity = int(100 * (1.0 + _SIN_TABLE[phase]) / 2)
         else:
             # Gentle glow for unlocked doors
-            intensity = int(50 * (1.0 + math.sin(self.glow_time)) / 2)
+            phase = int(self.glow_time * _SIN_TABLE_SCALE) & (_SIN_TABLE_SIZE - 1)
+            intensity = int(50 * (1.0 + _SIN_TABLE[phase]) / 2)
         
         if intensity > 0:
-            glow_surface = pygame.Surface((self.width + 8, self.height + 8))
-            glow_surface.set_alpha(intensity)
-            
             if self.is_unlocking:
-                glow_surface.fill((255, 255, 0))  # Yellow glow during unlock
+                glow_color = (255, 255, 0)  # Yellow glow during unlock
             else:
-                glow_surface.fill((0, 255, 0))    # Green glow when unlocked
+                glow_color = (0, 255, 0)    # Green glow when unlocked
             
+            glow_surface = self._get_glow_surface(glow_color)
+            glow_surface.set_alpha(intensity)
             screen.blit(glow_surface, (screen_x - 4, screen_y - 4))
     
+    def _get_glow_surface(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Get the shared glow surface for this door size and color.
+        
+        Args:
+            color: Glow color
+            
+        Returns:
+            Solid surface 8 pixels larger than the door in each dimension
+        """
+        cache_key = (self.width + 8, self.height + 8, color)
+        glow_surface = Door._glow_cache.get(cache_key)
+        if glow_surface is None:
+            glow_surface = pygame.Surface((cache_key[0], cache_key[1]))
+            if pygame.display.get_surface() is not None:
+                glow_surface = glow_surface.convert()
+            glow_surface.fill(color)
+            Door._glow_cache[cache_key] = glow_surface
+        return glow_surface
+    
     def _render_interaction_indicator(self, screen: pygame.Surface, screen_x: int, screen_y: int) -> None:
         """
         Render interaction indicator above the door.
@@ -262,45 +475,91 @@ class Door(GameObject):
             screen_x: Screen X position
             screen_y: Screen Y position
         """
+        center_x = screen_x + self._half_w_int
+        center_y = screen_y - 20
+        
         # Draw "E" key indicator
         try:
+            indicator = Door._get_indicator_surface()
+            screen.blit(indicator, (center_x - 12, center_y - 12))
+        except pygame.error:
+            # Fallback if font fails
+            pygame.draw.circle(screen, (255, 255, 255), (center_x, center_y), 8)
+    
+    @classmethod
+    def _get_indicator_surface(cls) -> pygame.Surface:
+        """
+        Get the pre-rendered "E" indicator, building it on first use.
+        The background circle, outline and text are composited into one surface.
+        
+        Returns:
+            24x24 surface with the interaction indicator
+        """
+        if cls._indicator_surface is None:
             font = pygame.font.Font(None, 24)
             text = font.render("E", True, (255, 255, 255))
-            text_rect = text.get_rect(center=(screen_x + self.width // 2, screen_y - 20))
             
-            # Background circle
-            pygame.draw.circle(screen, (0, 0, 0), text_rect.center, 12)
-            pygame.draw.circle(screen, (255, 255, 255), text_rect.center, 12, 2)
+            indicator = pygame.Surface((24, 24), pygame.SRCALPHA)
+            pygame.draw.circle(indicator, (0, 0, 0), (12, 12), 12)
+            pygame.draw.circle(indicator, (255, 255, 255), (12, 12), 12, 2)
+            indicator.blit(text, text.get_rect(center=(12, 12)))
             
-            screen.blit(text, text_rect)
-        except pygame.error:
-            # Fallback if font fails
-            pygame.draw.circle(screen, (255, 255, 255), (screen_x + self.width // 2, screen_y - 20), 8)
+            cls._indicator_surface = indicator
+        return cls._indicator_surface
     
     def get_bounds(self) -> pygame.Rect:
         """
         Get the bounding rectangle for collision detection.
+        Doors are stationary, so the inherited bounds Rect is only moved in
+        set_position; treat it as read-only and copy it if it needs to be
+        modified.
         
         Returns:
             Pygame Rect representing the door's bounds
         """
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        return self._bounds_rect
+    
+    def set_position(self, x: float, y: float) -> None:
+        """
+        Move the door, keeping the cached bounds and info in sync.
+        
+        Args:
+            x: New X coordinate
+            y: New Y coordinate
+        """
+        self.x = x
+        self.y = y
+        self._cx = x + self.width * 0.5
+        self._cy = y + self.height * 0.5
+        self._bounds_rect.topleft = (int(x), int(y))
+        if self._info is not None:
+            self._info['position'] = (x, y)
     
     def get_info(self) -> dict:
         """
         Get door information.
+        The returned dictionary is a cached snapshot shared between calls;
+        treat it as read-only and copy it if it needs to be modified.
         
         Returns:
             Dictionary containing door information
         """
-        return {
-            'door_id': self.door_id,
-            'position': (self.x, self.y),
-            'size': (self.width, self.height),
-            'is_locked': self.is_locked,
-            'is_open': self.is_open,
-            'target_map': self.target_map,
-            'target_position': self.target_position,
-            'can_interact': self.can_interact,
-            'unlock_condition': self.unlock_condition
-        }
\ No newline at end of file
+        info = self._info
+        if info is None:
+            info = self._info = {
+                'door_id': self.door_id,
+                'position': (self.x, self.y),
+                'size': (self.width, self.height),
+                'is_locked': self.is_locked,
+                'is_open': self.is_open,
+                'target_map': self.target_map,
+                'target_position': self.target_position,
+                'can_interact': self.can_interact,
+                'unlock_condition': self.unlock_condition
+            }
+        else:
+            # Only the state flags change during play
+            info['is_locked'] = self.is_locked
+            info['is_open'] = self.is_open
+            info['can_interact'] = self.can_interact
+        return info
\ No newline at end of file
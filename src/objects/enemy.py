@@ -1,11 +1,26 @@
 """
 Enemy class for hostile creatures in the game.
 """
+import logging
 import pygame
 import math
 import random
-from typing import Tuple, Optional
-from .game_object import GameObject
+from typing import Dict, Tuple, Optional
+from .game_object import (
+    GameObject, FACING_UP, FACING_DOWN, FACING_LEFT, FACING_RIGHT, FACING_NAMES, FACING_CODES
+)
+
+logger = logging.getLogger(__name__)
+
+# Module-level bindings for math and random calls made on every AI tick
+_sqrt = math.sqrt
+_getrandbits = random.getrandbits
+_random = random.random
+
+# Unit vectors for 256 evenly spaced patrol directions, indexed by 8 random bits
+_PATROL_DIRECTIONS = tuple(
+    (math.cos(i * 2 * math.pi / 256), math.sin(i * 2 * math.pi / 256)) for i in range(256)
+)
 
 
 class Enemy(GameObject):
@@ -13,6 +28,47 @@ class Enemy(GameObject):
     Base enemy class that handles AI movement patterns and combat.
     """
     
+    # '__dict__' keeps ad-hoc attributes working; it is only allocated if one is set
+    __slots__ = (
+        'enemy_type', 'max_health', 'current_health', 'speed', 'attack_damage', 'experience_reward',
+        'ai_state', 'target_position', 'last_player_position', '_detection_range', '_attack_range',
+        'patrol_radius', 'original_position', '_detection_range_sq', '_attack_range_sq',
+        'velocity_x', 'velocity_y', 'facing', 'ai_update_timer', 'ai_update_interval',
+        'state_change_timer', 'patrol_change_interval', 'is_attacking', 'attack_time',
+        'attack_duration', 'attack_cooldown', '_attack_cooldown_remaining', '_attack_rect', '__dict__'
+    )
+    
+    # AI tick intervals by distance to the player: within detection range,
+    # within twice the detection range, and further away or no player. The
+    # far interval only applies offscreen; visible enemies tick at least at
+    # the near interval so their patrols stay smooth
+    AI_INTERVAL_COMBAT = 0.05
+    AI_INTERVAL_NEAR = 0.1
+    AI_INTERVAL_FAR = 0.5
+    
+    # Placeholder sprites shared by all enemies, keyed by (enemy_type, width, height)
+    _sprite_cache: Dict[Tuple, pygame.Surface] = {}
+    
+    # Attack tint colors for the wind-up and active phases
+    WINDUP_TINT = (50, 50, 50)
+    ACTIVE_TINT = (100, 50, 50)
+    
+    # (wind-up, active) tinted copies, keyed by the untinted sprite
+    _tint_cache: Dict[pygame.Surface, Tuple[pygame.Surface, pygame.Surface]] = {}
+    
+    # Attack area offsets per facing code, keyed by (attack_range, width, height)
+    _attack_offset_cache: Dict[Tuple, Tuple[Tuple[int, int, int], ...]] = {}
+    
+    # Solid attack effect surfaces, keyed by (width, height)
+    ATTACK_EFFECT_COLOR = (200, 100, 100)
+    _attack_surface_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+    
+    # Health bar strips (filled row on top, background row below), keyed by width
+    HEALTH_BAR_HEIGHT = 4
+    HEALTH_BG_COLOR = (100, 0, 0)
+    HEALTH_FG_COLOR = (0, 150, 0)
+    _health_bar_cache: Dict[int, pygame.Surface] = {}
+    
     def __init__(self, x: float, y: float, enemy_type: str = "basic"):
         """
         Initialize the Enemy.
@@ -41,11 +97,11 @@ class Enemy(GameObject):
         # Movement
         self.velocity_x = 0.0
         self.velocity_y = 0.0
-        self.facing_direction = 'down'
+        self.facing = FACING_DOWN
         
         # AI timing
         self.ai_update_timer = 0.0
-        self.ai_update_interval = 0.1  # Update AI every 0.1 seconds
+        self.ai_update_interval = self.AI_INTERVAL_NEAR  # Adjusted by distance each AI tick
         self.state_change_timer = 0.0
         self.patrol_change_interval = 2.0  # Change patrol direction every 2 seconds
         
@@ -54,7 +110,8 @@ class Enemy(GameObject):
         self.attack_time = 0.0
         self.attack_duration = 0.4  # Attack animation duration
         self.attack_cooldown = 1.0  # Cooldown between attacks
-        self.last_attack_time = 0.0
+        self._attack_cooldown_remaining = 0.0  # Counts down with dt after each attack
+        self._attack_rect = pygame.Rect(0, 0, 0, 0)  # Reused by get_attack_rect
         
         # Create enemy sprite
         self._create_enemy_sprite()
@@ -102,8 +159,21 @@ class Enemy(GameObject):
         self.experience_reward = stats["experience_reward"]
     
     def _create_enemy_sprite(self) -> None:
-        """Create a sprite for the enemy based on type."""
-        self.sprite = pygame.Surface((self.width, self.height))
+        """Create a sprite for the enemy based on type, sharing one per type."""
+        cache_key = (self.enemy_type, self.width, self.height)
+        sprite = Enemy._sprite_cache.get(cache_key)
+        if sprite is None:
+            sprite = Enemy._sprite_cache[cache_key] = self._build_enemy_sprite()
+        self.sprite = sprite
+    
+    def _build_enemy_sprite(self) -> pygame.Surface:
+        """
+        Draw the placeholder sprite for this enemy's type.
+        
+        Returns:
+            Pygame surface with the enemy drawn on it
+        """
+        sprite = pygame.Surface((self.width, self.height))
         
         # Different colors for different enemy types
         enemy_colors = {
@@ -114,15 +184,20 @@ class Enemy(GameObject):
         }
         
         color = enemy_colors.get(self.enemy_type, enemy_colors["basic"])
-        self.sprite.fill(color)
+        sprite.fill(color)
         
         # Add simple visual features
         # Eyes
-        pygame.draw.circle(self.sprite, (255, 0, 0), (8, 8), 3)   # Red eyes
-        pygame.draw.circle(self.sprite, (255, 0, 0), (24, 8), 3)
+        pygame.draw.circle(sprite, (255, 0, 0), (8, 8), 3)   # Red eyes
+        pygame.draw.circle(sprite, (255, 0, 0), (24, 8), 3)
         
         # Mouth/teeth
-        pygame.draw.rect(self.sprite, (255, 255, 255), (12, 20, 8, 4))
+        pygame.draw.rect(sprite, (255, 255, 255), (12, 20, 8, 4))
+        
+        # Match the display format so blits take SDL's fast path
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+        return sprite
     
     def load_sprite_from_loader(self, sprite_loader) -> None:
         """
@@ -135,24 +210,77 @@ class Enemy(GameObject):
         if loaded_sprite:
             self.sprite = loaded_sprite
     
-    def update(self, dt: float, player_position: Optional[Tuple[float, float]] = None) -> None:
+    def update(self, dt: float, player_position: Optional[Tuple[float, float]] = None,
+               visible_area: Optional[Tuple[float, float, float, float]] = None) -> None:
         """
         Update the enemy state including AI and movement.
         
         Args:
             dt: Delta time since last frame in seconds
             player_position: Current player position for AI decisions
+            visible_area: Camera view as (left, top, right, bottom) in world
+                coordinates; None treats the enemy as offscreen
+        """
+        # Dead enemies wait for removal without running any logic
+        if self.active:
+            self._step(dt, player_position, visible_area)
+    
+    @classmethod
+    def update_batch(cls, enemies, dt: float, player_position: Optional[Tuple[float, float]] = None,
+                     visible_area: Optional[Tuple[float, float, float, float]] = None) -> None:
+        """
+        Update many enemies in one pass.
+        Equivalent to calling update() on each enemy; both run the same
+        per-enemy step.
+        
+        Args:
+            enemies: Enemies to update
+            dt: Delta time since last frame in seconds
+            player_position: Current player position for AI decisions
+            visible_area: Camera view as (left, top, right, bottom) in world
+                coordinates; None treats every enemy as offscreen
+        """
+        for enemy in enemies:
+            if enemy.active:
+                enemy._step(dt, player_position, visible_area)
+    
+    def _step(self, dt: float, player_position: Optional[Tuple[float, float]],
+              visible_area: Optional[Tuple[float, float, float, float]] = None) -> None:
+        """
+        Advance one live enemy by one frame; shared by update() and update_batch().
+        
+        Args:
+            dt: Delta time since last frame in seconds
+            player_position: Current player position for AI decisions
+            visible_area: Camera view as (left, top, right, bottom) in world coordinates
         """
         # Update attack state
         self._update_attack_state(dt)
         
         # Update AI
-        self._update_ai(dt, player_position)
+        self._update_ai(dt, player_position, visible_area)
         
         # Update position based on velocity
-        if not self.is_attacking:
-            self.x += self.velocity_x * dt
-            self.y += self.velocity_y * dt
+        if self.is_attacking:
+            return
+        step_x = self.velocity_x * dt
+        step_y = self.velocity_y * dt
+        
+        # Patrol arrival is checked every frame rather than on AI ticks, so
+        # a step never carries the enemy past its patrol target
+        target = self.target_position
+        if self.ai_state == "patrol" and target is not None:
+            dx = target[0] - (self.x + self._half_w)
+            dy = target[1] - (self.y + self._half_h)
+            if step_x * step_x + step_y * step_y >= dx * dx + dy * dy:
+                # Stop on the target; the next AI tick picks a new one
+                step_x = dx
+                step_y = dy
+                self.velocity_x = 0.0
+                self.velocity_y = 0.0
+        
+        self.x += step_x
+        self.y += step_y
     
     def _update_attack_state(self, dt: float) -> None:
         """
@@ -161,19 +289,23 @@ class Enemy(GameObject):
         Args:
             dt: Delta time since last frame
         """
+        if self._attack_cooldown_remaining > 0:
+            self._attack_cooldown_remaining -= dt
         if self.is_attacking:
             self.attack_time += dt
             if self.attack_time >= self.attack_duration:
                 self.is_attacking = False
                 self.attack_time = 0.0
     
-    def _update_ai(self, dt: float, player_position: Optional[Tuple[float, float]]) -> None:
+    def _update_ai(self, dt: float, player_position: Optional[Tuple[float, float]],
+                   visible_area: Optional[Tuple[float, float, float, float]] = None) -> None:
         """
         Update AI behavior and state machine.
         
         Args:
             dt: Delta time since last frame
             player_position: Current player position
+            visible_area: Camera view as (left, top, right, bottom) in world coordinates
         """
         self.ai_update_timer += dt
         self.state_change_timer += dt
@@ -183,23 +315,75 @@ class Enemy(GameObject):
             return
         
         self.ai_update_timer = 0.0
+        self._run_ai(dt, player_position, visible_area)
+    
+    def _run_ai(self, dt: float, player_position: Optional[Tuple[float, float]],
+                visible_area: Optional[Tuple[float, float, float, float]] = None) -> None:
+        """
+        Run one AI tick: pick a state from the player distance and act on it.
         
+        Args:
+            dt: Delta time since last frame
+            player_position: Current player position
+            visible_area: Camera view as (left, top, right, bottom) in world coordinates
+        """
         if player_position:
-            distance_to_player = self._calculate_distance(player_position)
+            distance_sq = self._distance_sq(player_position[0], player_position[1])
             
             # State transitions based on player distance
-            if distance_to_player <= self.attack_range and not self.is_attacking:
+            if distance_sq <= self._attack_range_sq and not self.is_attacking:
                 self._transition_to_attack(player_position)
-            elif distance_to_player <= self.detection_range:
+            elif distance_sq <= self._detection_range_sq:
                 self._transition_to_chase(player_position)
             else:
                 self._transition_to_patrol()
+            
+            # Tick more often the closer the player is
+            if distance_sq <= self._detection_range_sq:
+                self.ai_update_interval = self.AI_INTERVAL_COMBAT
+            elif distance_sq <= 4 * self._detection_range_sq:
+                self.ai_update_interval = self.AI_INTERVAL_NEAR
+            else:
+                self.ai_update_interval = self._far_interval(visible_area)
         else:
             self._transition_to_patrol()
+            self.ai_update_interval = self._far_interval(visible_area)
         
         # Execute current state behavior
         self._execute_ai_state(dt, player_position)
     
+    def _far_interval(self, visible_area: Optional[Tuple[float, float, float, float]]) -> float:
+        """
+        Get the AI interval for an enemy with no player nearby.
+        
+        Args:
+            visible_area: Camera view as (left, top, right, bottom) in world coordinates
+            
+        Returns:
+            AI_INTERVAL_FAR when offscreen, otherwise AI_INTERVAL_NEAR
+        """
+        if visible_area is not None:
+            left, top, right, bottom = visible_area
+            if not (self.x + self.width < left or self.x > right or
+                    self.y + self.height < top or self.y > bottom):
+                return self.AI_INTERVAL_NEAR
+        return self.AI_INTERVAL_FAR
+    
+    def _distance_sq(self, target_x: float, target_y: float) -> float:
+        """
+        Calculate the squared distance from the enemy center to a point.
+        
+        Args:
+            target_x: Target X coordinate
+            target_y: Target Y coordinate
+            
+        Returns:
+            Squared distance to target
+        """
+        dx = target_x - (self.x + self._half_w)
+        dy = target_y - (self.y + self._half_h)
+        return dx * dx + dy * dy
+    
     def _calculate_distance(self, target_position: Tuple[float, float]) -> float:
         """
         Calculate distance to target position.
@@ -210,9 +394,9 @@ class Enemy(GameObject):
         Returns:
             Distance to target
         """
-        dx = target_position[0] - (self.x + self.width / 2)
-        dy = target_position[1] - (self.y + self.height / 2)
-        return math.sqrt(dx * dx + dy * dy)
+        dx = target_position[0] - (self.x + self._half_w)
+        dy = target_position[1] - (self.y + self._half_h)
+        return _sqrt(dx * dx + dy * dy)
     
     def _transition_to_attack(self, player_position: Tuple[float, float]) -> None:
         """
@@ -270,14 +454,10 @@ class Enemy(GameObject):
         Args:
             player_position: Player position
         """
-        import time
-        current_time = time.time()
-        
         # Check if we can attack (cooldown)
-        if (current_time - self.last_attack_time >= self.attack_cooldown and 
-            not self.is_attacking):
+        if self._attack_cooldown_remaining <= 0 and not self.is_attacking:
             self.attack()
-            self.last_attack_time = current_time
+            self._attack_cooldown_remaining = self.attack_cooldown
     
     def _execute_chase_behavior(self, player_position: Optional[Tuple[float, float]]) -> None:
         """
@@ -301,8 +481,8 @@ class Enemy(GameObject):
         
         # Move towards patrol target
         if self.target_position:
-            distance_to_target = self._calculate_distance(self.target_position)
-            if distance_to_target < 10.0:  # Close enough to target
+            target_x, target_y = self.target_position
+            if self._distance_sq(target_x, target_y) < 100.0:  # Within 10 pixels of target
                 self._choose_new_patrol_target()
             else:
                 self._move_towards_target(self.target_position)
@@ -314,11 +494,11 @@ class Enemy(GameObject):
     
     def _choose_new_patrol_target(self) -> None:
         """Choose a new random patrol target within patrol radius."""
-        angle = random.uniform(0, 2 * math.pi)
-        distance = random.uniform(20, self.patrol_radius)
+        direction_x, direction_y = _PATROL_DIRECTIONS[_getrandbits(8)]
+        distance = 20 + (self.patrol_radius - 20) * _random()
         
-        target_x = self.original_position[0] + math.cos(angle) * distance
-        target_y = self.original_position[1] + math.sin(angle) * distance
+        target_x = self.original_position[0] + direction_x * distance
+        target_y = self.original_position[1] + direction_y * distance
         
         self.target_position = (target_x, target_y)
     
@@ -330,21 +510,20 @@ class Enemy(GameObject):
             target_position: Target position (x, y)
         """
         # Calculate direction to target
-        dx = target_position[0] - (self.x + self.width / 2)
-        dy = target_position[1] - (self.y + self.height / 2)
-        
-        # Normalize direction
-        distance = math.sqrt(dx * dx + dy * dy)
-        if distance > 0:
-            dx /= distance
-            dy /= distance
+        dx = target_position[0] - (self.x + self._half_w)
+        dy = target_position[1] - (self.y + self._half_h)
+        
+        # Normalize direction and scale to speed with a single reciprocal
+        distance_sq = dx * dx + dy * dy
+        if distance_sq > 0:
+            scale = self.speed / _sqrt(distance_sq)
             
             # Set velocity
-            self.velocity_x = dx * self.speed
-            self.velocity_y = dy * self.speed
+            self.velocity_x = dx * scale
+            self.velocity_y = dy * scale
             
-            # Update facing direction
-            self._update_facing_direction(target_position)
+            # Update facing direction from the same offsets
+            self._set_facing_from_offset(dx, dy)
         else:
             self.velocity_x = 0.0
             self.velocity_y = 0.0
@@ -356,14 +535,33 @@ class Enemy(GameObject):
         Args:
             target_position: Target position
         """
-        dx = target_position[0] - (self.x + self.width / 2)
-        dy = target_position[1] - (self.y + self.height / 2)
+        dx = target_position[0] - (self.x + self._half_w)
+        dy = target_position[1] - (self.y + self._half_h)
+        self._set_facing_from_offset(dx, dy)
+    
+    def _set_facing_from_offset(self, dx: float, dy: float) -> None:
+        """
+        Update facing direction from the offset between enemy center and target.
         
+        Args:
+            dx: Target X minus enemy center X
+            dy: Target Y minus enemy center Y
+        """
         # Determine primary direction
         if abs(dx) > abs(dy):
-            self.facing_direction = 'right' if dx > 0 else 'left'
+            self.facing = FACING_RIGHT if dx > 0 else FACING_LEFT
         else:
-            self.facing_direction = 'down' if dy > 0 else 'up'
+            self.facing = FACING_DOWN if dy > 0 else FACING_UP
+    
+    @property
+    def facing_direction(self) -> str:
+        """Facing direction as 'up', 'down', 'left' or 'right'."""
+        return FACING_NAMES[self.facing]
+    
+    @facing_direction.setter
+    def facing_direction(self, direction: str) -> None:
+        # Unknown directions fall back to facing down
+        self.facing = FACING_CODES.get(direction, FACING_DOWN)
     
     def attack(self) -> None:
         """Perform an attack action."""
@@ -372,7 +570,8 @@ class Enemy(GameObject):
         
         self.is_attacking = True
         self.attack_time = 0.0
-        print(f"{self.enemy_type} enemy attacks!")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s enemy attacks!", self.enemy_type)
     
     def take_damage(self, damage: int) -> bool:
         """
@@ -385,7 +584,9 @@ class Enemy(GameObject):
             True if enemy died, False otherwise
         """
         self.current_health = max(0, self.current_health - damage)
-        print(f"{self.enemy_type} enemy takes {damage} damage. Health: {self.current_health}/{self.max_health}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s enemy takes %d damage. Health: %d/%d",
+                         self.enemy_type, damage, self.current_health, self.max_health)
         
         if self.current_health <= 0:
             self.die()
@@ -395,37 +596,46 @@ class Enemy(GameObject):
     
     def die(self) -> None:
         """Handle enemy death."""
-        print(f"{self.enemy_type} enemy has died!")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s enemy has died!", self.enemy_type)
         self.active = False
     
     def get_attack_rect(self) -> pygame.Rect:
         """
         Get the attack rectangle based on enemy position and facing direction.
+        The Rect is reused between calls; copy it if it needs to outlive
+        the next call or be modified.
         
         Returns:
             Pygame Rect representing the attack area
         """
-        attack_size = int(self.attack_range)
+        cache_key = (self.attack_range, self.width, self.height)
+        offsets = Enemy._attack_offset_cache.get(cache_key)
+        if offsets is None:
+            offsets = Enemy._attack_offset_cache[cache_key] = self._build_attack_offsets()
+        offset_x, offset_y, attack_size = offsets[self.facing]
         
-        # Calculate attack position based on facing direction
-        if self.facing_direction == 'up':
-            attack_x = self.x - (attack_size - self.width) // 2
-            attack_y = self.y - attack_size
-        elif self.facing_direction == 'down':
-            attack_x = self.x - (attack_size - self.width) // 2
-            attack_y = self.y + self.height
-        elif self.facing_direction == 'left':
-            attack_x = self.x - attack_size
-            attack_y = self.y - (attack_size - self.height) // 2
-        elif self.facing_direction == 'right':
-            attack_x = self.x + self.width
-            attack_y = self.y - (attack_size - self.height) // 2
-        else:
-            # Default to down direction
-            attack_x = self.x - (attack_size - self.width) // 2
-            attack_y = self.y + self.height
+        attack_rect = self._attack_rect
+        attack_rect.update(self.x + offset_x, self.y + offset_y, attack_size, attack_size)
+        return attack_rect
+    
+    def _build_attack_offsets(self) -> Tuple[Tuple[int, int, int], ...]:
+        """
+        Compute the attack area placement for every facing direction.
         
-        return pygame.Rect(attack_x, attack_y, attack_size, attack_size)
+        Returns:
+            Tuple of (offset_x, offset_y, size) indexed by facing code
+            (up, down, left, right)
+        """
+        attack_size = int(self.attack_range)
+        center_x_offset = (attack_size - self.width) // 2
+        center_y_offset = (attack_size - self.height) // 2
+        return (
+            (-center_x_offset, -attack_size, attack_size),
+            (-center_x_offset, self.height, attack_size),
+            (-attack_size, -center_y_offset, attack_size),
+            (self.width, -center_y_offset, attack_size),
+        )
     
     def is_attack_active(self) -> bool:
         """
@@ -463,13 +673,11 @@ class Enemy(GameObject):
         screen_x = int(self.x - camera_x)
         screen_y = int(self.y - camera_y)
         
-        # Get current sprite (with attack effects if attacking)
-        current_sprite = self._get_current_sprite()
-        
         # Only render if enemy is visible on screen
         if (screen_x + self.width >= 0 and screen_x < screen.get_width() and
             screen_y + self.height >= 0 and screen_y < screen.get_height()):
-            screen.blit(current_sprite, (screen_x, screen_y))
+            # Get current sprite (with attack effects if attacking)
+            screen.blit(self._get_current_sprite(), (screen_x, screen_y))
             
             # Render health bar
             self._render_health_bar(screen, screen_x, screen_y)
@@ -478,6 +686,51 @@ class Enemy(GameObject):
             if self.is_attacking:
                 self._render_attack_effect(screen, camera_x, camera_y)
     
+    @classmethod
+    def render_batch(cls, enemies, screen: pygame.Surface,
+                     camera_x: float = 0, camera_y: float = 0) -> None:
+        """
+        Render a group of enemies with batched blits.
+        Enemies outside the clip area are culled in one pass, visible
+        sprites are drawn with a single Surface.blits call, and health
+        bars and attack effects are drawn on top afterwards.
+        
+        Args:
+            enemies: Enemies to render
+            screen: Pygame surface to render to
+            camera_x: Camera X offset
+            camera_y: Camera Y offset
+        """
+        clip = screen.get_clip()
+        clip_left, clip_top, clip_right, clip_bottom = clip.left, clip.top, clip.right, clip.bottom
+        
+        sprite_blits = []
+        overlays = []
+        for enemy in enemies:
+            if not enemy.active or not enemy.sprite:
+                continue
+            
+            # Convert world coordinates to screen coordinates
+            screen_x = int(enemy.x - camera_x)
+            screen_y = int(enemy.y - camera_y)
+            
+            # Skip enemies outside the clip area
+            if (screen_x + enemy.width < clip_left or screen_x >= clip_right or
+                screen_y + enemy.height < clip_top or screen_y >= clip_bottom):
+                continue
+            
+            sprite_blits.append((enemy._get_current_sprite(), (screen_x, screen_y)))
+            if enemy.is_attacking or enemy.current_health < enemy.max_health:
+                overlays.append((enemy, screen_x, screen_y))
+        
+        if sprite_blits:
+            screen.blits(sprite_blits, doreturn=False)
+        
+        for enemy, screen_x, screen_y in overlays:
+            enemy._render_health_bar(screen, screen_x, screen_y)
+            if enemy.is_attacking:
+                enemy._render_attack_effect(screen, camera_x, camera_y)
+    
     def _get_current_sprite(self) -> pygame.Surface:
         """
         Get the current sprite with any effects applied.
@@ -486,21 +739,34 @@ class Enemy(GameObject):
             Pygame surface representing current sprite
         """
         if self.is_attacking:
-            # Create attack effect sprite
-            attack_sprite = self.sprite.copy()
             attack_progress = self.attack_time / self.attack_duration
             
             if attack_progress <= 0.3:
                 # Wind-up phase
-                attack_sprite.fill((50, 50, 50), special_flags=pygame.BLEND_ADD)
+                return self._get_attack_tints()[0]
             elif attack_progress <= 0.7:
                 # Active attack phase
-                attack_sprite.fill((100, 50, 50), special_flags=pygame.BLEND_ADD)
-            
-            return attack_sprite
+                return self._get_attack_tints()[1]
         
         return self.sprite
     
+    def _get_attack_tints(self) -> Tuple[pygame.Surface, pygame.Surface]:
+        """
+        Get the tinted attack variants of the current sprite, building them on first use.
+        
+        Returns:
+            Tuple of (wind-up sprite, active attack sprite)
+        """
+        sprite = self.sprite
+        tints = Enemy._tint_cache.get(sprite)
+        if tints is None:
+            windup_sprite = sprite.copy()
+            windup_sprite.fill(self.WINDUP_TINT, special_flags=pygame.BLEND_ADD)
+            active_sprite = sprite.copy()
+            active_sprite.fill(self.ACTIVE_TINT, special_flags=pygame.BLEND_ADD)
+            tints = Enemy._tint_cache[sprite] = (windup_sprite, active_sprite)
+        return tints
+    
     def _render_health_bar(self, screen: pygame.Surface, screen_x: int, screen_y: int) -> None:
         """
         Render enemy health bar above the sprite.
@@ -514,19 +780,40 @@ class Enemy(GameObject):
             return  # Don't show health bar at full health
         
         bar_width = self.width
-        bar_height = 4
-        bar_y = screen_y - 8
+        bar_height = self.HEALTH_BAR_HEIGHT
+        bar_position = (screen_x, screen_y - 8)
+        bar_surface = self._get_health_bar_surface(bar_width)
         
         # Background (red)
-        health_bg_rect = pygame.Rect(screen_x, bar_y, bar_width, bar_height)
-        pygame.draw.rect(screen, (100, 0, 0), health_bg_rect)
+        screen.blit(bar_surface, bar_position, (0, bar_height, bar_width, bar_height))
         
         # Foreground (green)
         health_percentage = self.current_health / self.max_health
         health_width = int(bar_width * health_percentage)
         if health_width > 0:
-            health_fg_rect = pygame.Rect(screen_x, bar_y, health_width, bar_height)
-            pygame.draw.rect(screen, (0, 150, 0), health_fg_rect)
+            screen.blit(bar_surface, bar_position, (0, 0, health_width, bar_height))
+    
+    @classmethod
+    def _get_health_bar_surface(cls, width: int) -> pygame.Surface:
+        """
+        Get the shared health bar strip for a width, building it on first use.
+        
+        Args:
+            width: Bar width in pixels
+            
+        Returns:
+            Surface with the filled bar on top and the background bar below
+        """
+        bar_surface = cls._health_bar_cache.get(width)
+        if bar_surface is None:
+            bar_height = cls.HEALTH_BAR_HEIGHT
+            bar_surface = pygame.Surface((width, bar_height * 2))
+            if pygame.display.get_surface() is not None:
+                bar_surface = bar_surface.convert()
+            bar_surface.fill(cls.HEALTH_FG_COLOR, (0, 0, width, bar_height))
+            bar_surface.fill(cls.HEALTH_BG_COLOR, (0, bar_height, width, bar_height))
+            cls._health_bar_cache[width] = bar_surface
+        return bar_surface
     
     def _render_attack_effect(self, screen: pygame.Surface, camera_x: float, camera_y: float) -> None:
         """
@@ -550,21 +837,41 @@ class Enemy(GameObject):
             attack_rect.height
         )
         
-        # Create attack effect
-        attack_progress = self.attack_time / self.attack_duration
-        alpha = int(150 * (1.0 - attack_progress))
-        
-        attack_surface = pygame.Surface((screen_attack_rect.width, screen_attack_rect.height))
-        attack_surface.set_alpha(alpha)
-        attack_surface.fill((200, 100, 100))
-        
         # Only render if attack area is visible on screen
         if (screen_attack_rect.x < screen.get_width() and 
             screen_attack_rect.x + screen_attack_rect.width > 0 and
             screen_attack_rect.y < screen.get_height() and 
             screen_attack_rect.y + screen_attack_rect.height > 0):
+            # Fade the shared effect surface out over the attack
+            attack_progress = self.attack_time / self.attack_duration
+            alpha = int(150 * (1.0 - attack_progress))
+            
+            attack_surface = self._get_attack_surface(screen_attack_rect.width, screen_attack_rect.height)
+            attack_surface.set_alpha(alpha)
             screen.blit(attack_surface, (screen_attack_rect.x, screen_attack_rect.y))
     
+    @classmethod
+    def _get_attack_surface(cls, width: int, height: int) -> pygame.Surface:
+        """
+        Get the shared attack effect surface for a size, building it on first use.
+        
+        Args:
+            width: Effect width in pixels
+            height: Effect height in pixels
+            
+        Returns:
+            Solid surface filled with the attack effect color
+        """
+        cache_key = (width, height)
+        attack_surface = cls._attack_surface_cache.get(cache_key)
+        if attack_surface is None:
+            attack_surface = pygame.Surface(cache_key)
+            if pygame.display.get_surface() is not None:
+                attack_surface = attack_surface.convert()
+            attack_surface.fill(cls.ATTACK_EFFECT_COLOR)
+            cls._attack_surface_cache[cache_key] = attack_surface
+        return attack_surface
+    
     def get_stats(self) -> dict:
         """
         Get enemy statistics.
@@ -586,15 +893,6 @@ class Enemy(GameObject):
             'active': self.active
         }
     
-    def get_bounds(self) -> pygame.Rect:
-        """
-        Get the bounding rectangle for collision detection.
-        
-        Returns:
-            Pygame Rect representing the enemy's bounds
-        """
-        return pygame.Rect(self.x, self.y, self.width, self.height)
-    
     def set_patrol_area(self, center_x: float, center_y: float, radius: float) -> None:
         """
         Set the patrol area for this enemy.
@@ -607,6 +905,39 @@ class Enemy(GameObject):
         self.original_position = (center_x, center_y)
         self.patrol_radius = radius
     
+    def set_ranges(self, detection_range: float, attack_range: float) -> None:
+        """
+        Set the detection and attack ranges for this enemy.
+        
+        Args:
+            detection_range: Range at which the enemy notices the player
+            attack_range: Range at which the enemy attacks
+        """
+        self.detection_range = detection_range
+        self.attack_range = attack_range
+    
+    @property
+    def detection_range(self) -> float:
+        """Distance in pixels at which the enemy notices the player."""
+        return self._detection_range
+    
+    @detection_range.setter
+    def detection_range(self, detection_range: float) -> None:
+        # Keep the squared range used by the AI checks in sync
+        self._detection_range = detection_range
+        self._detection_range_sq = detection_range * detection_range
+    
+    @property
+    def attack_range(self) -> float:
+        """Distance in pixels at which the enemy attacks the player."""
+        return self._attack_range
+    
+    @attack_range.setter
+    def attack_range(self, attack_range: float) -> None:
+        # Keep the squared range used by the AI checks in sync
+        self._attack_range = attack_range
+        self._attack_range_sq = attack_range * attack_range
+    
     def reset_to_patrol(self) -> None:
         """Reset enemy to patrol state."""
         self.ai_state = "patrol"
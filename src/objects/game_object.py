@@ -5,6 +5,11 @@ Provides basic functionality for position, size, rendering, and updates.
 import pygame
 from typing import Tuple, Optional
 
+# Facing direction codes, indexing FACING_NAMES
+FACING_UP, FACING_DOWN, FACING_LEFT, FACING_RIGHT = 0, 1, 2, 3
+FACING_NAMES = ('up', 'down', 'left', 'right')
+FACING_CODES = {name: code for code, name in enumerate(FACING_NAMES)}
+
 
 class GameObject:
     """
@@ -12,6 +17,8 @@ class GameObject:
     Provides common functionality like position, size, rendering interface.
     """
     
+    __slots__ = ('x', 'y', 'width', 'height', '_half_w', '_half_h', '_bounds_rect', 'sprite', 'active')
+    
     def __init__(self, x: float, y: float, width: int = 32, height: int = 32):
         """
         Initialize a GameObject.
@@ -26,6 +33,9 @@ class GameObject:
         self.y = y
         self.width = width
         self.height = height
+        self._half_w = width * 0.5
+        self._half_h = height * 0.5
+        self._bounds_rect = pygame.Rect(x, y, width, height)  # Reused by get_bounds
         self.sprite: Optional[pygame.Surface] = None
         self.active = True
         
@@ -62,11 +72,15 @@ class GameObject:
     def get_bounds(self) -> pygame.Rect:
         """
         Get the bounding rectangle for collision detection.
+        The Rect is reused between calls; copy it if it needs to outlive
+        the next call or be modified.
         
         Returns:
             pygame.Rect representing the object's bounds
         """
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        bounds = self._bounds_rect
+        bounds.update(self.x, self.y, self.width, self.height)
+        return bounds
     
     def get_position(self) -> Tuple[float, float]:
         """
@@ -108,6 +122,8 @@ class GameObject:
         if sprite:
             self.width = sprite.get_width()
             self.height = sprite.get_height()
+            self._half_w = self.width * 0.5
+            self._half_h = self.height * 0.5
     
     def destroy(self) -> None:
         """
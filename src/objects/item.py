@@ -1,16 +1,31 @@
 """
 Item class for collectible objects in the game.
 """
+import logging
+import math
+import random
 import pygame
-from typing import Dict, Any, Optional, Callable
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Callable, Mapping, Tuple
 from .game_object import GameObject
 
+logger = logging.getLogger(__name__)
+
+# Module-level binding for the per-frame bobbing math
+_sin = math.sin
+
 
 class Item(GameObject):
     """
     Base class for all collectible items in the game.
     """
     
+    __slots__ = (
+        'item_type', 'item_data', 'name', 'category', '_effect', 'description', 'color',
+        'collected', 'bob_time', 'bob_speed', 'bob_height', 'original_y',
+        '_collection_radius', '_collection_radius_sq', 'auto_collect', '_glow_surface'
+    )
+    
     # Item type definitions
     ITEM_TYPES = {
         'health_potion': {
@@ -78,6 +93,23 @@ class Item(GameObject):
         }
     }
     
+    # Read-only view of ITEM_TYPES handed out by get_item_types()
+    ITEM_TYPES_VIEW = MappingProxyType(ITEM_TYPES)
+    
+    # Item type names in definition order, for random drops
+    _ITEM_TYPE_KEYS = tuple(ITEM_TYPES)
+    
+    # Placeholder sprites shared by all items, keyed by (item_type, width, height).
+    # Shared sprites are read-only; never draw onto an item's sprite in place.
+    _sprite_cache: Dict[Tuple, pygame.Surface] = {}
+    
+    # Consumable effect handlers, keyed by item_type and resolved on first use
+    _consumable_handlers: Dict[str, Callable[['Item', Any], bool]] = {}
+    
+    # Glow surfaces with the item alpha baked in, keyed by (width, height, color)
+    GLOW_ALPHA = 100
+    _glow_cache: Dict[Tuple, pygame.Surface] = {}
+    
     def __init__(self, x: float, y: float, item_type: str):
         """
         Initialize an Item.
@@ -93,17 +125,19 @@ class Item(GameObject):
             raise ValueError(f"Unknown item type: {item_type}")
         
         self.item_type = item_type
-        self.item_data = self.ITEM_TYPES[item_type].copy()
+        # Shared type definition; treat as read-only
+        self.item_data = self.ITEM_TYPES[item_type]
         
         # Item properties
         self.name = self.item_data['name']
         self.category = self.item_data['type']
-        self.effect = self.item_data['effect'].copy()
+        self._effect = None  # Per-item effect copy, made on first access
         self.description = self.item_data['description']
         
         # Visual properties
         self.color = self.item_data['color']
         self.collected = False
+        self._glow_surface: Optional[pygame.Surface] = None  # Resolved on first render
         
         # Animation properties
         self.bob_time = 0.0
@@ -119,21 +153,22 @@ class Item(GameObject):
         self._create_sprite()
     
     def _create_sprite(self) -> None:
-        """Create the visual sprite for this item."""
+        """Create the visual sprite for this item, sharing one per type."""
+        cache_key = (self.item_type, self.width, self.height)
+        sprite = Item._sprite_cache.get(cache_key)
+        if sprite is None:
+            self._build_item_sprite()
+            Item._sprite_cache[cache_key] = self.sprite
+        else:
+            self.sprite = sprite
+    
+    def _build_item_sprite(self) -> None:
+        """Draw the placeholder sprite for this item's type into self.sprite."""
         self.sprite = pygame.Surface((self.width, self.height))
         self.sprite.fill(self.color)
         
         # Add visual details based on item type
-        if self.category == 'consumable':
-            self._create_potion_sprite()
-        elif self.category == 'weapon':
-            self._create_weapon_sprite()
-        elif self.category == 'armor':
-            self._create_armor_sprite()
-        elif self.category == 'equipment':
-            self._create_equipment_sprite()
-        else:
-            self._create_generic_sprite()
+        Item._SPRITE_BUILDERS.get(self.category, Item._create_generic_sprite)(self)
     
     def load_sprite_from_loader(self, sprite_loader) -> None:
         """
@@ -182,7 +217,7 @@ class Item(GameObject):
     def _create_equipment_sprite(self) -> None:
         """Create sprite for equipment items."""
         # Draw boot shape for speed boots
-        if 'speed' in self.effect:
+        if 'speed' in self.item_data['effect']:
             pygame.draw.ellipse(self.sprite, self.color, (2, 8, 20, 12))
             pygame.draw.rect(self.sprite, self.color, (2, 12, 20, 8))
             # Add laces
@@ -207,6 +242,14 @@ class Item(GameObject):
             (12, 4), (16, 8), (12, 12), (8, 8)
         ])
     
+    # Detail drawing per item category; other categories get the generic gem
+    _SPRITE_BUILDERS = {
+        'consumable': _create_potion_sprite,
+        'weapon': _create_weapon_sprite,
+        'armor': _create_armor_sprite,
+        'equipment': _create_equipment_sprite,
+    }
+    
     def update(self, dt: float) -> None:
         """
         Update the item state.
@@ -218,10 +261,28 @@ class Item(GameObject):
             return
         
         # Update bobbing animation
-        self.bob_time += dt * self.bob_speed
-        import math
-        bob_offset = pygame.math.Vector2(0, self.bob_height * math.sin(self.bob_time))
-        self.y = self.original_y + bob_offset.y
+        bob_time = self.bob_time + dt * self.bob_speed
+        self.bob_time = bob_time
+        self.y = self.original_y + self.bob_height * _sin(bob_time)
+    
+    @classmethod
+    def update_batch(cls, items: list, dt: float) -> None:
+        """
+        Update a group of items in one pass.
+        Equivalent to calling update() on each active item, with the bobbing
+        math done inline.
+        
+        Args:
+            items: Items to update
+            dt: Delta time since last frame in seconds
+        """
+        for item in items:
+            if item.collected or not item.active:
+                continue
+            
+            bob_time = item.bob_time + dt * item.bob_speed
+            item.bob_time = bob_time
+            item.y = item.original_y + item.bob_height * _sin(bob_time)
     
     def render(self, screen: pygame.Surface, camera_x: float = 0, camera_y: float = 0) -> None:
         """
@@ -238,20 +299,82 @@ class Item(GameObject):
         # Convert world coordinates to screen coordinates
         screen_x = int(self.x - camera_x)
         screen_y = int(self.y - camera_y)
+        screen_width, screen_height = screen.get_size()
         
         # Only render if item is visible on screen
-        if (screen_x + self.width >= 0 and screen_x < screen.get_width() and
-            screen_y + self.height >= 0 and screen_y < screen.get_height()):
+        if (screen_x + self.width >= 0 and screen_x < screen_width and
+            screen_y + self.height >= 0 and screen_y < screen_height):
             
             # Add glow effect for items
-            glow_surface = pygame.Surface((self.width + 4, self.height + 4))
-            glow_surface.set_alpha(100)
-            glow_surface.fill(self.color)
-            screen.blit(glow_surface, (screen_x - 2, screen_y - 2))
+            screen.blit(self._get_glow_surface(), (screen_x - 2, screen_y - 2))
             
             # Render the main sprite
             screen.blit(self.sprite, (screen_x, screen_y))
     
+    @classmethod
+    def render_batch(cls, items: list, screen: pygame.Surface,
+                     camera_x: float = 0, camera_y: float = 0) -> None:
+        """
+        Render a group of items with one batched blit.
+        Items outside the clip area are culled in one pass, and the glow and
+        sprite of every visible item are drawn with a single Surface.blits call.
+        
+        Args:
+            items: Items to render
+            screen: Pygame surface to render to
+            camera_x: Camera X offset
+            camera_y: Camera Y offset
+        """
+        clip = screen.get_clip()
+        clip_left, clip_top, clip_right, clip_bottom = clip.left, clip.top, clip.right, clip.bottom
+        
+        blits = []
+        for item in items:
+            if item.collected or not item.active:
+                continue
+            
+            # Convert world coordinates to screen coordinates
+            screen_x = int(item.x - camera_x)
+            screen_y = int(item.y - camera_y)
+            
+            # Skip items outside the clip area
+            if (screen_x + item.width < clip_left or screen_x >= clip_right or
+                screen_y + item.height < clip_top or screen_y >= clip_bottom):
+                continue
+            
+            # Glow first so each item's sprite is drawn over its own glow
+            glow_surface = item._glow_surface
+            if glow_surface is None:
+                glow_surface = item._get_glow_surface()
+            blits.append((glow_surface, (screen_x - 2, screen_y - 2)))
+            blits.append((item.sprite, (screen_x, screen_y)))
+        
+        if blits:
+            screen.blits(blits, doreturn=False)
+    
+    def _get_glow_surface(self) -> pygame.Surface:
+        """
+        Get the shared glow surface for this item size and color.
+        The surface is looked up once and then kept on the item.
+        
+        Returns:
+            Translucent surface 4 pixels larger than the item in each dimension
+        """
+        if self._glow_surface is not None:
+            return self._glow_surface
+        
+        cache_key = (self.width + 4, self.height + 4, self.color)
+        glow_surface = Item._glow_cache.get(cache_key)
+        if glow_surface is None:
+            glow_surface = pygame.Surface((cache_key[0], cache_key[1]))
+            if pygame.display.get_surface() is not None:
+                glow_surface = glow_surface.convert()
+            glow_surface.fill(self.color)
+            glow_surface.set_alpha(self.GLOW_ALPHA)
+            Item._glow_cache[cache_key] = glow_surface
+        self._glow_surface = glow_surface
+        return glow_surface
+    
     def can_be_collected_by(self, player) -> bool:
         """
         Check if this item can be collected by the given player.
@@ -265,16 +388,60 @@ class Item(GameObject):
         if self.collected or not self.active:
             return False
         
-        # Check if player is close enough
-        player_center = player.get_center()
-        item_center = self.get_center()
+        # Check if player is close enough (squared distance, no sqrt)
+        player_x, player_y = player.get_center()
         
-        distance = pygame.math.Vector2(
-            player_center[0] - item_center[0],
-            player_center[1] - item_center[1]
-        ).length()
+        dx = player_x - (self.x + self._half_w)
+        dy = player_y - (self.y + self._half_h)
+        return (dx * dx + dy * dy) <= self._collection_radius_sq
+    
+    @classmethod
+    def find_collectible(cls, items: list, player_center: Tuple[float, float]) -> list:
+        """
+        Find every item within collection range of a player in one pass.
+        Equivalent to filtering items with can_be_collected_by, with the
+        player center unpacked once and the distance math done inline.
         
-        return distance <= self.collection_radius
+        Args:
+            items: Items to check
+            player_center: Player center in world coordinates
+            
+        Returns:
+            List of items the player is close enough to collect
+        """
+        player_x, player_y = player_center
+        collectible = []
+        for item in items:
+            if item.collected or not item.active:
+                continue
+            
+            dx = player_x - (item.x + item._half_w)
+            dy = player_y - (item.y + item._half_h)
+            if dx * dx + dy * dy <= item._collection_radius_sq:
+                collectible.append(item)
+        return collectible
+    
+    @property
+    def effect(self) -> Dict[str, Any]:
+        """Effect parameters of this item, copied from its type on first access."""
+        if self._effect is None:
+            self._effect = self.item_data['effect'].copy()
+        return self._effect
+    
+    @effect.setter
+    def effect(self, effect: Dict[str, Any]) -> None:
+        self._effect = effect
+    
+    @property
+    def collection_radius(self) -> float:
+        """Distance in pixels within which the player can collect this item."""
+        return self._collection_radius
+    
+    @collection_radius.setter
+    def collection_radius(self, radius: float) -> None:
+        # Keep the squared radius used by can_be_collected_by in sync
+        self._collection_radius = radius
+        self._collection_radius_sq = radius * radius
     
     def collect(self, player) -> bool:
         """
@@ -315,33 +482,64 @@ class Item(GameObject):
         Returns:
             True if effect was applied successfully
         """
-        if 'health' in self.effect:
-            # Only heal if player is not at full health
-            if player.current_health < player.max_health:
-                player.heal(self.effect['health'])
-                return True
-            else:
-                # Player is at full health, add to inventory instead
-                return player.add_item(self)
-        
-        elif 'mana' in self.effect:
-            # TODO: Implement mana system
-            print(f"Player would gain {self.effect['mana']} mana")
-            return True
-        
-        elif 'experience' in self.effect:
-            player.add_experience(self.effect['experience'])
-            return True
+        handler = Item._consumable_handlers.get(self.item_type)
+        if handler is None:
+            handler = Item._select_consumable_handler(self.item_data['effect'])
+            Item._consumable_handlers[self.item_type] = handler
+        return handler(self, player)
+    
+    @staticmethod
+    def _select_consumable_handler(effect: Dict[str, Any]) -> Callable[['Item', Any], bool]:
+        """
+        Pick the consumable handler for an item type's effect definition.
         
-        elif 'attack_boost' in self.effect or 'speed_boost' in self.effect:
-            # Apply temporary status effect
-            effect_name = f"{self.item_type}_effect"
-            player.apply_status_effect(effect_name, self.effect)
+        Args:
+            effect: Effect parameters from the item type definition
+            
+        Returns:
+            Unbound Item method that applies the effect to a player
+        """
+        if 'health' in effect:
+            return Item._apply_health_effect
+        elif 'mana' in effect:
+            return Item._apply_mana_effect
+        elif 'experience' in effect:
+            return Item._apply_experience_effect
+        elif 'attack_boost' in effect or 'speed_boost' in effect:
+            return Item._apply_boost_effect
+        # Unknown consumable effect, add to inventory
+        return Item._add_to_inventory
+    
+    def _apply_health_effect(self, player) -> bool:
+        """Heal the player, or keep the item if the player is at full health."""
+        # Only heal if player is not at full health
+        if player.current_health < player.max_health:
+            player.heal(self.effect['health'])
             return True
-        
-        else:
-            # Unknown consumable effect, add to inventory
-            return player.add_item(self)
+        # Player is at full health, add to inventory instead
+        return player.add_item(self)
+    
+    def _apply_mana_effect(self, player) -> bool:
+        """Restore the player's mana."""
+        # TODO: Implement mana system
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Player would gain %s mana", self.effect['mana'])
+        return True
+    
+    def _apply_experience_effect(self, player) -> bool:
+        """Grant the player experience."""
+        player.add_experience(self.effect['experience'])
+        return True
+    
+    def _apply_boost_effect(self, player) -> bool:
+        """Apply a temporary status effect to the player."""
+        effect_name = f"{self.item_type}_effect"
+        player.apply_status_effect(effect_name, self.effect)
+        return True
+    
+    def _add_to_inventory(self, player) -> bool:
+        """Add the item to the player's inventory."""
+        return player.add_item(self)
     
     def _on_collected(self, player) -> None:
         """
@@ -350,7 +548,8 @@ class Item(GameObject):
         Args:
             player: Player who collected the item
         """
-        print(f"Collected {self.name}: {self.description}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Collected %s: %s", self.name, self.description)
     
     def use_on_player(self, player) -> bool:
         """
@@ -380,7 +579,8 @@ class Item(GameObject):
         Returns:
             True if item was equipped successfully
         """
-        print(f"Equipped {self.name} on player")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Equipped %s on player", self.name)
         
         # The actual stat application will be handled by the inventory system
         # when the item is equipped, to avoid double application
@@ -416,16 +616,16 @@ class Item(GameObject):
         Returns:
             Random Item instance
         """
-        import random
-        item_type = random.choice(list(cls.ITEM_TYPES.keys()))
+        item_type = random.choice(cls._ITEM_TYPE_KEYS)
         return cls(x, y, item_type)
     
     @classmethod
-    def get_item_types(cls) -> Dict[str, Dict[str, Any]]:
+    def get_item_types(cls) -> Mapping[str, Dict[str, Any]]:
         """
         Get all available item types.
+        Callers that need to modify the result must copy it first.
         
         Returns:
-            Dictionary of item type definitions
+            Read-only mapping of item type definitions
         """
-        return cls.ITEM_TYPES.copy()
\ No newline at end of file
+        return cls.ITEM_TYPES_VIEW
\ No newline at end of file
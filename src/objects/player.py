@@ -2,17 +2,51 @@
 Player class for the main character controlled by the user.
 """
 import pygame
+import heapq
 import json
-from typing import Tuple, Optional
-from .game_object import GameObject
+import logging
+import os
+from typing import Dict, Tuple, Optional
+from .game_object import GameObject, FACING_DOWN, FACING_NAMES, FACING_CODES
+# Import systems with fallback for running from inside src
+try:
+    from src.systems.inventory_system import Inventory
+except ImportError:
+    from systems.inventory_system import Inventory
 # InputSystem will be passed as parameter, no need to import
 
+logger = logging.getLogger(__name__)
+
+# Animation offset of the third walk frame, indexed by facing code
+_STRIDE_OFFSETS = ((0, 1), (0, 1), (-1, 0), (1, 0))
+
 
 class Player(GameObject):
     """
     Player character class that handles user input and movement.
     """
     
+    __slots__ = (
+        'settings', 'max_health', 'current_health', 'base_speed', 'speed', '_cached_speed', 'level', 'experience',
+        'velocity_x', 'velocity_y', '_last_movement', 'facing', 'last_facing',
+        'boundary_left', 'boundary_right', 'boundary_top', 'boundary_bottom', '_max_x', '_max_y',
+        'animation_time', 'animation_frame', 'animation_speed', 'max_animation_frames', 'is_moving',
+        'is_attacking', 'attack_time', 'attack_duration', 'attack_cooldown', 'last_attack_time',
+        '_attack_damage', '_total_attack_damage', 'attack_range', '_attack_rect', '_screen_rect', 'direction_sprites', '_facing_sprites', '_sprite_variants',
+        'inventory', 'status_effects', '_effect_expiry_heap', '_game_time', 'temporary_attack_bonus',
+        'temporary_speed_multiplier', 'health_regen_rate', '__dict__'
+    )
+    
+    # Parsed settings files shared by all players, keyed by absolute path -> (mtime, settings)
+    _settings_cache: Dict[str, Tuple[float, dict]] = {}
+    
+    # Solid attack effect surfaces, keyed by (width, height)
+    ATTACK_EFFECT_COLOR = (255, 100, 100)
+    _attack_surface_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+    
+    # Attack area offsets per facing code, keyed by (attack_range, width, height)
+    _attack_offset_cache: Dict[Tuple, Tuple[Tuple[int, int, int], ...]] = {}
+    
     def __init__(self, x: float, y: float, settings_file: str = "config/settings.json"):
         """
         Initialize the Player.
@@ -32,20 +66,23 @@ class Player(GameObject):
         self.current_health = self.max_health
         self.base_speed = self.settings.get('game', {}).get('player_speed', 100)
         self.speed = self.base_speed
+        self._cached_speed = self.base_speed  # Movement speed, see _get_current_speed
         self.level = 1
         self.experience = 0
         
         # Movement state
         self.velocity_x = 0.0
         self.velocity_y = 0.0
-        self.facing_direction = 'down'  # Default facing direction
-        self.last_facing_direction = 'down'
+        self._last_movement = None  # (movement_x, movement_y, speed) last applied by handle_input
+        self.facing = FACING_DOWN  # Facing code, see facing_direction
+        self.last_facing = FACING_DOWN
         
         # Movement boundaries (will be set by game/scene)
         self.boundary_left = 0
         self.boundary_right = 800  # Default screen width
         self.boundary_top = 0
         self.boundary_bottom = 600  # Default screen height
+        self._update_movement_limits()
         
         # Animation state
         self.animation_time = 0.0
@@ -59,27 +96,43 @@ class Player(GameObject):
         self.attack_time = 0.0
         self.attack_duration = 0.3  # Attack animation duration in seconds
         self.attack_cooldown = 0.5  # Cooldown between attacks
-        self.last_attack_time = 0.0
-        self.attack_damage = 20  # Base attack damage
+        self.last_attack_time = float('-inf')  # Game time of the last attack
+        self._attack_damage = 20  # Base attack damage, see attack_damage
         self.attack_range = 40  # Attack range in pixels
+        self._attack_rect = pygame.Rect(0, 0, 0, 0)  # Reused by get_attack_rect
+        
+        # Screen-space rect reused by render for visibility tests
+        self._screen_rect = pygame.Rect(0, 0, self.width, self.height)
         
-        # Direction-specific sprites
+        # Direction-specific sprites, by name and indexed by facing code
         self.direction_sprites = {}
+        self._facing_sprites = []
+        # Offset and tinted frames, keyed by (base sprite, offset or tint)
+        self._sprite_variants = {}
         self._create_direction_sprites()
         
         # Inventory
-        from src.systems.inventory_system import Inventory
         self.inventory = Inventory(max_size=20)
         
+        # Game clock in seconds, advanced by update(); drives attack cooldowns
+        # and status effect timing so they follow pauses and dt scaling
+        self._game_time = 0.0
+        
         # Status effects and temporary bonuses
         self.status_effects = {}  # Dictionary of active status effects
+        # Min-heap of (end_time, effect_name); entries for removed or
+        # re-applied effects go stale and are skipped when popped
+        self._effect_expiry_heap = []
         self.temporary_attack_bonus = 0
+        self._total_attack_damage = self._attack_damage  # Base damage plus temporary bonus
         self.temporary_speed_multiplier = 1.0
         self.health_regen_rate = 0  # Health regeneration per second
     
     def _load_settings(self, settings_file: str) -> dict:
         """
         Load settings from JSON file.
+        Parsed files are cached and reused until their modification time
+        changes; the returned dictionary is shared and must not be modified.
         
         Args:
             settings_file: Path to settings file
@@ -87,11 +140,24 @@ class Player(GameObject):
         Returns:
             Dictionary containing settings
         """
+        try:
+            cache_key = os.path.abspath(settings_file)
+            mtime = os.stat(cache_key).st_mtime
+        except OSError:
+            cache_key = None
+        else:
+            cached = Player._settings_cache.get(cache_key)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+        
         try:
             with open(settings_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                settings = json.load(f)
+            if cache_key is not None and isinstance(settings, dict):
+                Player._settings_cache[cache_key] = (mtime, settings)
+            return settings
         except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Warning: Could not load settings file {settings_file}: {e}")
+            logger.warning("Could not load settings file %s: %s", settings_file, e)
             return {
                 'game': {
                     'player_speed': 100,
@@ -101,13 +167,18 @@ class Player(GameObject):
     
     def _create_default_sprite(self):
         """Create a default sprite for the player (colored rectangle)."""
-        self.sprite = pygame.Surface((self.width, self.height))
-        self.sprite.fill((0, 100, 200))  # Blue color for player
+        sprite = pygame.Surface((self.width, self.height))
+        sprite.fill((0, 100, 200))  # Blue color for player
         
         # Add a simple face to distinguish direction
-        pygame.draw.circle(self.sprite, (255, 255, 255), (8, 8), 3)  # Left eye
-        pygame.draw.circle(self.sprite, (255, 255, 255), (24, 8), 3)  # Right eye
-        pygame.draw.circle(self.sprite, (255, 255, 255), (16, 20), 5)  # Mouth
+        pygame.draw.circle(sprite, (255, 255, 255), (8, 8), 3)  # Left eye
+        pygame.draw.circle(sprite, (255, 255, 255), (24, 8), 3)  # Right eye
+        pygame.draw.circle(sprite, (255, 255, 255), (16, 20), 5)  # Mouth
+        
+        # Match the display format so blits take SDL's fast path
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+        self.sprite = sprite
     
     def _create_direction_sprites(self):
         """Create sprites for each direction."""
@@ -115,8 +186,9 @@ class Player(GameObject):
         self._create_default_sprite()
         
         # Create direction-specific sprites
-        for direction in ['up', 'down', 'left', 'right']:
+        for direction in FACING_NAMES:
             self.direction_sprites[direction] = self._create_directional_sprite(direction)
+        self._facing_sprites = [self.direction_sprites[direction] for direction in FACING_NAMES]
     
     def load_sprite_from_loader(self, sprite_loader) -> None:
         """
@@ -129,8 +201,10 @@ class Player(GameObject):
         if loaded_sprite:
             self.sprite = loaded_sprite
             # Update direction sprites to use the loaded sprite as base
-            for direction in ['up', 'down', 'left', 'right']:
+            for direction in FACING_NAMES:
                 self.direction_sprites[direction] = loaded_sprite.copy()
+            self._facing_sprites = [self.direction_sprites[direction] for direction in FACING_NAMES]
+            self._sprite_variants.clear()
     
     def _create_directional_sprite(self, direction: str) -> pygame.Surface:
         """
@@ -167,6 +241,9 @@ class Player(GameObject):
             pygame.draw.circle(sprite, (255, 255, 255), (26, 16), 3)
             pygame.draw.circle(sprite, (255, 255, 255), (16, 12), 3)
         
+        # Match the display format so blits take SDL's fast path
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
         return sprite
     
     def handle_input(self, input_system) -> None:
@@ -182,19 +259,25 @@ class Player(GameObject):
         # Apply speed modifiers (could be affected by items, status effects, etc.)
         current_speed = self._get_current_speed()
         
-        # Update velocity based on input with speed control
-        self.velocity_x = movement_x * current_speed
-        self.velocity_y = movement_y * current_speed
-        
-        # Update facing direction and movement state
-        if movement_x != 0 or movement_y != 0:
-            self.is_moving = True
-            new_direction = input_system.get_movement_direction()
-            if new_direction != 'idle':
-                self.facing_direction = new_direction
-                self.last_facing_direction = new_direction
-        else:
-            self.is_moving = False
+        # Velocity and facing only change when the input or the speed does
+        movement = (movement_x, movement_y, current_speed)
+        if movement != self._last_movement:
+            self._last_movement = movement
+            
+            # Update velocity based on input with speed control
+            self.velocity_x = movement_x * current_speed
+            self.velocity_y = movement_y * current_speed
+            
+            # Update facing direction and movement state
+            if movement_x != 0 or movement_y != 0:
+                self.is_moving = True
+                # 'idle' has no facing code and keeps the current facing
+                facing = FACING_CODES.get(input_system.get_movement_direction())
+                if facing is not None:
+                    self.facing = facing
+                    self.last_facing = facing
+            else:
+                self.is_moving = False
         
         # Handle action inputs
         if input_system.is_action_just_pressed('attack'):
@@ -203,6 +286,25 @@ class Player(GameObject):
         if input_system.is_action_just_pressed('interact'):
             self.interact()
     
+    @property
+    def facing_direction(self) -> str:
+        """Facing direction as 'up', 'down', 'left' or 'right'."""
+        return FACING_NAMES[self.facing]
+    
+    @facing_direction.setter
+    def facing_direction(self, direction: str) -> None:
+        # Unknown directions fall back to facing down
+        self.facing = FACING_CODES.get(direction, FACING_DOWN)
+    
+    @property
+    def last_facing_direction(self) -> str:
+        """Last direction the player moved in, kept while standing still."""
+        return FACING_NAMES[self.last_facing]
+    
+    @last_facing_direction.setter
+    def last_facing_direction(self, direction: str) -> None:
+        self.last_facing = FACING_CODES.get(direction, FACING_DOWN)
+    
     def _get_current_speed(self) -> float:
         """
         Get the current movement speed, accounting for modifiers.
@@ -210,16 +312,8 @@ class Player(GameObject):
         Returns:
             Current movement speed
         """
-        # Base speed can be modified by items, status effects, etc.
-        speed_modifier = 1.0
-        
-        # Example: could add speed boosts, slowdowns, etc.
-        # if self.has_speed_boost:
-        #     speed_modifier *= 1.5
-        # if self.is_slowed:
-        #     speed_modifier *= 0.5
-        
-        return self.base_speed * speed_modifier
+        # base_speed scaled by the active speed effects, refreshed when one is applied or removed
+        return self._cached_speed
     
     def update(self, dt: float) -> None:
         """
@@ -236,12 +330,17 @@ class Player(GameObject):
         
         # Only move if not attacking (or allow movement during attack)
         if not self.is_attacking:
-            # Calculate new position
+            # Calculate new position, clamped inline to the movement boundaries
             new_x = self.x + self.velocity_x * dt
             new_y = self.y + self.velocity_y * dt
-            
-            # Apply boundary checking
-            new_x, new_y = self._apply_boundary_constraints(new_x, new_y)
+            if new_x > self._max_x:
+                new_x = self._max_x
+            if new_x < self.boundary_left:
+                new_x = self.boundary_left
+            if new_y > self._max_y:
+                new_y = self._max_y
+            if new_y < self.boundary_top:
+                new_y = self.boundary_top
             
             # Update position
             self.x = new_x
@@ -250,27 +349,6 @@ class Player(GameObject):
         # Update animation
         self._update_animation(dt)
     
-    def _apply_boundary_constraints(self, new_x: float, new_y: float) -> Tuple[float, float]:
-        """
-        Apply boundary constraints to prevent player from moving outside allowed area.
-        
-        Args:
-            new_x: Proposed new X position
-            new_y: Proposed new Y position
-            
-        Returns:
-            Tuple of constrained (x, y) position
-        """
-        # Constrain X position
-        constrained_x = max(self.boundary_left, 
-                           min(new_x, self.boundary_right - self.width))
-        
-        # Constrain Y position
-        constrained_y = max(self.boundary_top, 
-                           min(new_y, self.boundary_bottom - self.height))
-        
-        return (constrained_x, constrained_y)
-    
     def _update_animation(self, dt: float) -> None:
         """
         Update animation state.
@@ -304,20 +382,21 @@ class Player(GameObject):
         # Convert world coordinates to screen coordinates
         screen_x = int(self.x - camera_x)
         screen_y = int(self.y - camera_y)
-        
-        # Create animated sprite based on movement and attack state
-        animated_sprite = self._get_animated_sprite()
-        
-        # Only render if player is visible on screen
-        if (screen_x + self.width >= 0 and screen_x < screen.get_width() and
-            screen_y + self.height >= 0 and screen_y < screen.get_height()):
-            screen.blit(animated_sprite, (screen_x, screen_y))
+        screen_rect = self._screen_rect
+        screen_rect.update(screen_x, screen_y, self.width, self.height)
+        clip = screen.get_clip()
+        
+        # Only render if player overlaps the visible area
+        if screen_rect.colliderect(clip):
+            # Create animated sprite based on movement and attack state
+            screen.blit(self._get_animated_sprite(), (screen_x, screen_y))
             
             # Render attack visualization if attacking
             if self.is_attacking:
-                self._render_attack_effect(screen, camera_x, camera_y)
+                self._render_attack_effect(screen, camera_x, camera_y, clip)
     
-    def _render_attack_effect(self, screen: pygame.Surface, camera_x: float, camera_y: float) -> None:
+    def _render_attack_effect(self, screen: pygame.Surface, camera_x: float, camera_y: float,
+                              clip: Optional[pygame.Rect] = None) -> None:
         """
         Render attack effect visualization.
         
@@ -325,16 +404,23 @@ class Player(GameObject):
             screen: Pygame surface to render to
             camera_x: Camera X offset
             camera_y: Camera Y offset
+            clip: Screen clip area, if already known this frame
         """
-        attack_rect = self.get_attack_rect()
+        if clip is None:
+            clip = screen.get_clip()
         
         # Convert attack rect to screen coordinates
-        screen_attack_rect = pygame.Rect(
-            attack_rect.x - camera_x,
-            attack_rect.y - camera_y,
-            attack_rect.width,
-            attack_rect.height
-        )
+        attack_rect = self.get_attack_rect()
+        attack_width = attack_rect.width
+        attack_height = attack_rect.height
+        attack_x = int(attack_rect.x - camera_x)
+        attack_y = int(attack_rect.y - camera_y)
+        
+        # Only render if attack area overlaps the visible area
+        screen_rect = self._screen_rect
+        screen_rect.update(attack_x, attack_y, attack_width, attack_height)
+        if not screen_rect.colliderect(clip):
+            return
         
         # Calculate attack effect intensity based on attack time
         attack_progress = self.attack_time / self.attack_duration
@@ -342,22 +428,34 @@ class Player(GameObject):
         # Create attack effect color (red with varying alpha)
         if attack_progress <= 0.6:  # Active damage phase
             alpha = int(255 * (1.0 - attack_progress / 0.6))
-            color = (255, 100, 100, alpha)
         else:  # Cooldown phase
             alpha = int(100 * (1.0 - (attack_progress - 0.6) / 0.4))
-            color = (255, 200, 200, alpha)
         
-        # Create a surface for the attack effect
-        attack_surface = pygame.Surface((screen_attack_rect.width, screen_attack_rect.height))
+        attack_surface = self._get_attack_surface(attack_width, attack_height)
         attack_surface.set_alpha(alpha)
-        attack_surface.fill((255, 100, 100))
+        screen.blit(attack_surface, (attack_x, attack_y))
+    
+    @classmethod
+    def _get_attack_surface(cls, width: int, height: int) -> pygame.Surface:
+        """
+        Get the shared attack effect surface for a size, building it on first use.
         
-        # Only render if attack area is visible on screen
-        if (screen_attack_rect.x < screen.get_width() and 
-            screen_attack_rect.x + screen_attack_rect.width > 0 and
-            screen_attack_rect.y < screen.get_height() and 
-            screen_attack_rect.y + screen_attack_rect.height > 0):
-            screen.blit(attack_surface, (screen_attack_rect.x, screen_attack_rect.y))
+        Args:
+            width: Effect width in pixels
+            height: Effect height in pixels
+            
+        Returns:
+            Solid surface filled with the attack effect color
+        """
+        cache_key = (width, height)
+        attack_surface = cls._attack_surface_cache.get(cache_key)
+        if attack_surface is None:
+            attack_surface = pygame.Surface(cache_key)
+            if pygame.display.get_surface() is not None:
+                attack_surface = attack_surface.convert()
+            attack_surface.fill(cls.ATTACK_EFFECT_COLOR)
+            cls._attack_surface_cache[cache_key] = attack_surface
+        return attack_surface
     
     def _get_animated_sprite(self) -> pygame.Surface:
         """
@@ -367,8 +465,7 @@ class Player(GameObject):
             Pygame surface representing current animation frame
         """
         # Get the base sprite for current direction
-        direction = self.facing_direction if self.is_moving else self.last_facing_direction
-        base_sprite = self.direction_sprites.get(direction, self.sprite)
+        base_sprite = self._facing_sprites[self.facing if self.is_moving else self.last_facing]
         
         # Handle attack animation
         if self.is_attacking:
@@ -377,20 +474,22 @@ class Player(GameObject):
         if not self.is_moving:
             return base_sprite
         
-        # Create animated version based on animation frame
-        animated_sprite = base_sprite.copy()
-        
         # Apply animation effects based on frame
         animation_offset = self._get_animation_offset()
+        if animation_offset == (0, 0):
+            return base_sprite
         
-        if animation_offset != (0, 0):
+        # Offset frames are built once per base sprite and reused
+        cache_key = (base_sprite, animation_offset)
+        animated_sprite = self._sprite_variants.get(cache_key)
+        if animated_sprite is None:
             # Create a new surface for the animated sprite
-            new_sprite = pygame.Surface((self.width, self.height))
-            new_sprite.fill((0, 100, 200))  # Base color
+            animated_sprite = pygame.Surface((self.width, self.height))
+            animated_sprite.fill((0, 100, 200))  # Base color
             
             # Copy the base sprite with offset
-            new_sprite.blit(base_sprite, animation_offset)
-            animated_sprite = new_sprite
+            animated_sprite.blit(base_sprite, animation_offset)
+            self._sprite_variants[cache_key] = animated_sprite
         
         return animated_sprite
     
@@ -404,22 +503,28 @@ class Player(GameObject):
         Returns:
             Pygame surface with attack animation effects
         """
-        attack_sprite = base_sprite.copy()
-        
         # Calculate attack animation progress
         attack_progress = self.attack_time / self.attack_duration
         
         # Add visual effects for attack
         if attack_progress <= 0.3:
             # Wind-up phase - slight color change
-            attack_sprite.fill((150, 150, 255), special_flags=pygame.BLEND_ADD)
+            tint = (150, 150, 255)
         elif attack_progress <= 0.6:
             # Active attack phase - bright flash
-            attack_sprite.fill((255, 200, 200), special_flags=pygame.BLEND_ADD)
+            tint = (255, 200, 200)
         else:
             # Recovery phase - fade back to normal
             fade_amount = int(100 * (1.0 - (attack_progress - 0.6) / 0.4))
-            attack_sprite.fill((fade_amount, fade_amount // 2, fade_amount // 2), special_flags=pygame.BLEND_ADD)
+            tint = (fade_amount, fade_amount // 2, fade_amount // 2)
+        
+        # Tinted frames are built once per base sprite and tint and reused
+        cache_key = (base_sprite, tint)
+        attack_sprite = self._sprite_variants.get(cache_key)
+        if attack_sprite is None:
+            attack_sprite = base_sprite.copy()
+            attack_sprite.fill(tint, special_flags=pygame.BLEND_ADD)
+            self._sprite_variants[cache_key] = attack_sprite
         
         return attack_sprite
     
@@ -433,25 +538,19 @@ class Player(GameObject):
         if not self.is_moving:
             return (0, 0)
         
-        # Create subtle bobbing effect
-        if self.animation_frame in [1, 3]:
-            # Slight vertical offset for "step" frames
+        # Step frames bob vertically, the stride frame shifts along the facing
+        frame = self.animation_frame
+        if frame == 1 or frame == 3:
             return (0, -1)
-        elif self.animation_frame == 2:
-            # Slight horizontal offset for variety
-            if self.facing_direction in ['left', 'right']:
-                return (1 if self.facing_direction == 'right' else -1, 0)
-            else:
-                return (0, 1)
-        
+        if frame == 2:
+            return _STRIDE_OFFSETS[self.facing]
         return (0, 0)
     
     def attack(self) -> None:
         """
         Perform an attack action.
         """
-        import time
-        current_time = time.time()
+        current_time = self._game_time
         
         # Check if attack is on cooldown
         if current_time - self.last_attack_time < self.attack_cooldown:
@@ -466,7 +565,8 @@ class Player(GameObject):
         self.attack_time = 0.0
         self.last_attack_time = current_time
         
-        print(f"Player attacks in direction: {self.facing_direction}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Player attacks in direction: %s", self.facing_direction)
     
     def _update_attack_state(self, dt: float) -> None:
         """
@@ -484,32 +584,39 @@ class Player(GameObject):
     def get_attack_rect(self) -> pygame.Rect:
         """
         Get the attack rectangle based on player position and facing direction.
+        The Rect is reused between calls; copy it if it needs to outlive
+        the next call or be modified.
         
         Returns:
             Pygame Rect representing the attack area
         """
-        attack_width = self.attack_range
-        attack_height = self.attack_range
-        
-        # Calculate attack position based on facing direction
-        if self.facing_direction == 'up':
-            attack_x = self.x - (attack_width - self.width) // 2
-            attack_y = self.y - attack_height
-        elif self.facing_direction == 'down':
-            attack_x = self.x - (attack_width - self.width) // 2
-            attack_y = self.y + self.height
-        elif self.facing_direction == 'left':
-            attack_x = self.x - attack_width
-            attack_y = self.y - (attack_height - self.height) // 2
-        elif self.facing_direction == 'right':
-            attack_x = self.x + self.width
-            attack_y = self.y - (attack_height - self.height) // 2
-        else:
-            # Default to down direction
-            attack_x = self.x - (attack_width - self.width) // 2
-            attack_y = self.y + self.height
+        cache_key = (self.attack_range, self.width, self.height)
+        offsets = Player._attack_offset_cache.get(cache_key)
+        if offsets is None:
+            offsets = Player._attack_offset_cache[cache_key] = self._build_attack_offsets()
+        offset_x, offset_y, attack_size = offsets[self.facing]
         
-        return pygame.Rect(attack_x, attack_y, attack_width, attack_height)
+        attack_rect = self._attack_rect
+        attack_rect.update(self.x + offset_x, self.y + offset_y, attack_size, attack_size)
+        return attack_rect
+    
+    def _build_attack_offsets(self) -> Tuple[Tuple[int, int, int], ...]:
+        """
+        Compute the attack area placement for every facing direction.
+        
+        Returns:
+            Tuple of (offset_x, offset_y, size) indexed by facing code
+            (up, down, left, right)
+        """
+        attack_size = self.attack_range
+        center_x_offset = (attack_size - self.width) // 2
+        center_y_offset = (attack_size - self.height) // 2
+        return (
+            (-center_x_offset, -attack_size, attack_size),
+            (-center_x_offset, self.height, attack_size),
+            (-attack_size, -center_y_offset, attack_size),
+            (self.width, -center_y_offset, attack_size),
+        )
     
     def is_attack_active(self) -> bool:
         """
@@ -543,7 +650,8 @@ class Player(GameObject):
         Perform an interaction action.
         """
         # TODO: Implement interaction logic
-        print("Player interacts")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Player interacts")
     
     def collect_item(self, item) -> bool:
         """
@@ -675,36 +783,43 @@ class Player(GameObject):
             effect_name: Name of the effect
             effect_data: Dictionary containing effect parameters
         """
-        import time
-        
         # If effect already exists, remove it first to prevent stacking
         if effect_name in self.status_effects:
             self.remove_status_effect(effect_name)
         
-        # Calculate end time for the effect
+        # Calculate end time for the effect on the game clock
+        current_time = self._game_time
         duration = effect_data.get('duration', 0)
-        end_time = time.time() + duration if duration > 0 else float('inf')
+        end_time = current_time + duration if duration > 0 else float('inf')
         
         # Store the effect
         self.status_effects[effect_name] = {
             'data': effect_data.copy(),
             'end_time': end_time,
-            'start_time': time.time()
+            'start_time': current_time
         }
+        if duration > 0:
+            heapq.heappush(self._effect_expiry_heap, (end_time, effect_name))
         
         # Apply immediate effects
         if 'attack_boost' in effect_data:
             self.temporary_attack_bonus += effect_data['attack_boost']
-            print(f"Attack increased by {effect_data['attack_boost']} for {duration} seconds")
+            self._total_attack_damage = self._attack_damage + self.temporary_attack_bonus
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Attack increased by %s for %s seconds", effect_data['attack_boost'], duration)
         
         if 'speed_boost' in effect_data:
             self.temporary_speed_multiplier *= effect_data['speed_boost']
             self.set_speed_modifier(self.temporary_speed_multiplier)
-            print(f"Speed increased by {(effect_data['speed_boost'] - 1) * 100:.0f}% for {duration} seconds")
+            self._cached_speed = self.base_speed * self.temporary_speed_multiplier
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Speed increased by %.0f%% for %s seconds",
+                             (effect_data['speed_boost'] - 1) * 100, duration)
         
         if 'health_regen' in effect_data:
             self.health_regen_rate += effect_data['health_regen']
-            print(f"Health regeneration increased by {effect_data['health_regen']} per second")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Health regeneration increased by %s per second", effect_data['health_regen'])
     
     def remove_status_effect(self, effect_name: str) -> None:
         """
@@ -713,57 +828,54 @@ class Player(GameObject):
         Args:
             effect_name: Name of the effect to remove
         """
-        if effect_name not in self.status_effects:
+        # Take the effect out of the active set with a single lookup
+        effect_info = self.status_effects.pop(effect_name, None)
+        if effect_info is None:
             return
         
-        effect_data = self.status_effects[effect_name]['data']
+        effect_data = effect_info['data']
         
         # Remove the effects
         if 'attack_boost' in effect_data:
             self.temporary_attack_bonus -= effect_data['attack_boost']
-            print(f"Attack boost of {effect_data['attack_boost']} has worn off")
+            self._total_attack_damage = self._attack_damage + self.temporary_attack_bonus
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Attack boost of %s has worn off", effect_data['attack_boost'])
         
         if 'speed_boost' in effect_data:
             self.temporary_speed_multiplier /= effect_data['speed_boost']
             self.set_speed_modifier(self.temporary_speed_multiplier)
-            print(f"Speed boost has worn off")
+            self._cached_speed = self.base_speed * self.temporary_speed_multiplier
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Speed boost has worn off")
         
         if 'health_regen' in effect_data:
             self.health_regen_rate -= effect_data['health_regen']
-            print(f"Health regeneration effect has worn off")
-        
-        # Remove from active effects
-        del self.status_effects[effect_name]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Health regeneration effect has worn off")
     
     def update_status_effects(self, dt: float) -> None:
         """
         Update all active status effects.
+        Advances the player's game clock by dt before checking for expiry.
         
         Args:
             dt: Delta time since last frame
         """
-        import time
-        current_time = time.time()
+        self._game_time += dt
+        current_time = self._game_time
         
-        # Check for expired effects
-        expired_effects = []
-        for effect_name, effect_info in self.status_effects.items():
-            if current_time >= effect_info['end_time']:
-                expired_effects.append(effect_name)
-        
-        # Remove expired effects
-        for effect_name in expired_effects:
-            self.remove_status_effect(effect_name)
+        # Remove expired effects, soonest first
+        expiry_heap = self._effect_expiry_heap
+        while expiry_heap and expiry_heap[0][0] <= current_time:
+            end_time, effect_name = heapq.heappop(expiry_heap)
+            effect_info = self.status_effects.get(effect_name)
+            if effect_info is not None and effect_info['end_time'] == end_time:
+                self.remove_status_effect(effect_name)
         
-        # Apply continuous effects
-        if self.health_regen_rate > 0:
-            regen_amount = self.health_regen_rate * dt
-            if self.current_health < self.max_health:
-                old_health = self.current_health
-                self.current_health = min(self.max_health, self.current_health + regen_amount)
-                if self.current_health > old_health:
-                    # Only print if we actually regenerated health
-                    pass  # Don't spam the console with regen messages
+        # Apply continuous effects; regeneration is not logged to avoid per-frame spam
+        if self.health_regen_rate > 0 and self.current_health < self.max_health:
+            self.current_health = min(self.max_health, self.current_health + self.health_regen_rate * dt)
     
     def get_total_attack_damage(self) -> int:
         """
@@ -772,7 +884,18 @@ class Player(GameObject):
         Returns:
             Total attack damage
         """
-        return self.attack_damage + self.temporary_attack_bonus
+        return self._total_attack_damage
+    
+    @property
+    def attack_damage(self) -> int:
+        """Base attack damage, before temporary bonuses."""
+        return self._attack_damage
+    
+    @attack_damage.setter
+    def attack_damage(self, damage: int) -> None:
+        # Equipment changes the base damage directly; keep the total in sync
+        self._attack_damage = damage
+        self._total_attack_damage = damage + self.temporary_attack_bonus
     
     def has_status_effect(self, effect_name: str) -> bool:
         """
@@ -809,7 +932,8 @@ class Player(GameObject):
             damage: Amount of damage to take
         """
         self.current_health = max(0, self.current_health - damage)
-        print(f"Player takes {damage} damage. Health: {self.current_health}/{self.max_health}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Player takes %d damage. Health: %d/%d", damage, self.current_health, self.max_health)
         
         if self.current_health <= 0:
             self.die()
@@ -824,14 +948,15 @@ class Player(GameObject):
         old_health = self.current_health
         self.current_health = min(self.max_health, self.current_health + amount)
         healed = self.current_health - old_health
-        if healed > 0:
-            print(f"Player healed for {healed}. Health: {self.current_health}/{self.max_health}")
+        if healed > 0 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Player healed for %d. Health: %d/%d", healed, self.current_health, self.max_health)
     
     def die(self) -> None:
         """
         Handle player death.
         """
-        print("Player has died!")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Player has died!")
         # TODO: Implement death logic (game over screen, respawn, etc.)
     
     def add_experience(self, exp: int) -> None:
@@ -842,7 +967,8 @@ class Player(GameObject):
             exp: Experience points to add
         """
         self.experience += exp
-        print(f"Player gains {exp} experience. Total: {self.experience}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Player gains %d experience. Total: %d", exp, self.experience)
         
         # Simple level up logic (every 100 exp = 1 level)
         new_level = (self.experience // 100) + 1
@@ -864,8 +990,9 @@ class Player(GameObject):
         self.max_health += health_increase
         self.current_health += health_increase  # Also heal on level up
         
-        print(f"Player leveled up! Level {old_level} -> {new_level}")
-        print(f"Max health increased by {health_increase}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Player leveled up! Level %d -> %d", old_level, new_level)
+            logger.debug("Max health increased by %d", health_increase)
     
     def add_item(self, item) -> bool:
         """
@@ -878,10 +1005,11 @@ class Player(GameObject):
             True if item was added, False if inventory is full
         """
         success = self.inventory.add_item(item)
-        if success:
-            print(f"Added {item.name if hasattr(item, 'name') else item} to inventory")
-        else:
-            print("Inventory is full!")
+        if logger.isEnabledFor(logging.DEBUG):
+            if success:
+                logger.debug("Added %s to inventory", getattr(item, 'name', item))
+            else:
+                logger.debug("Inventory is full!")
         return success
     
     def remove_item(self, item) -> bool:
@@ -895,10 +1023,11 @@ class Player(GameObject):
             True if item was removed, False if item not found
         """
         success = self.inventory.remove_item(item)
-        if success:
-            print(f"Removed {item.name if hasattr(item, 'name') else item} from inventory")
-        else:
-            print(f"{item.name if hasattr(item, 'name') else item} not found in inventory")
+        if logger.isEnabledFor(logging.DEBUG):
+            if success:
+                logger.debug("Removed %s from inventory", getattr(item, 'name', item))
+            else:
+                logger.debug("%s not found in inventory", getattr(item, 'name', item))
         return success
     
     def get_health_percentage(self) -> float:
@@ -924,6 +1053,22 @@ class Player(GameObject):
         self.boundary_top = top
         self.boundary_right = right
         self.boundary_bottom = bottom
+        self._update_movement_limits()
+    
+    def _update_movement_limits(self) -> None:
+        """Recompute the largest allowed position from the boundaries and player size."""
+        self._max_x = self.boundary_right - self.width
+        self._max_y = self.boundary_bottom - self.height
+    
+    def set_sprite(self, sprite: pygame.Surface) -> None:
+        """
+        Set the sprite for the player, keeping movement limits in sync with its size.
+        
+        Args:
+            sprite: Pygame surface to use as the sprite
+        """
+        super().set_sprite(sprite)
+        self._update_movement_limits()
     
     def set_speed_modifier(self, modifier: float) -> None:
         """
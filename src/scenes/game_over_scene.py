@@ -57,6 +57,9 @@ class GameOverScene(Scene):
         self.game = game
         self.screen_width, self.screen_height = game.get_screen_size()
         
+        # This scene fills the whole screen itself every frame
+        game.set_opaque(True)
+        
         # Initialize fonts
         try:
             self.title_font = pygame.font.Font(None, 72)
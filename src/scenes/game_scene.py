@@ -132,6 +132,9 @@ class GameScene(Scene):
         self.game = game
         self.game_config = game.config.get('game', {})
         
+        # This scene fills the whole screen itself every frame
+        game.set_opaque(True)
+        
         # Initialize core systems
         self._initialize_systems()
         
@@ -176,6 +179,7 @@ class GameScene(Scene):
         
         # Sprite loader
         self.sprite_loader = SpriteLoader(self.game.resource_manager)
+        self.sprite_loader.build_atlas()
         
         print("Game systems initialized")
     
@@ -895,18 +899,17 @@ class GameScene(Scene):
                     self._handle_map_transition
                 )
         
-        # Update enemies
-        for enemy in self.enemies[:]:  # Use slice to allow removal during iteration
-            enemy.update(dt)
-            
-            # Update enemy AI and movement
+        # Update enemy AI and movement
+        if self.enemies:
+            visible_area = self.camera.get_visible_area() if self.camera else None
             if self.player:
-                enemy.update(dt, (self.player.x, self.player.y))
+                Enemy.update_batch(self.enemies, dt, (self.player.x, self.player.y), visible_area)
             else:
-                enemy.update(dt)
-            
-            # Handle enemy-map collisions
-            if self.collision_system and self.current_map_data:
+                Enemy.update_batch(self.enemies, dt, None, visible_area)
+        
+        # Handle enemy-map collisions
+        if self.collision_system and self.current_map_data:
+            for enemy in self.enemies:
                 # Check if enemy would collide with map at new position
                 old_x, old_y = enemy.x, enemy.y
                 if self.collision_system.check_map_collision(enemy, enemy.x, enemy.y):
@@ -923,12 +926,14 @@ class GameScene(Scene):
             # Update combat system (handles all combat interactions)
             self.combat_system.update(dt, self.player)
             
-            # Remove dead enemies
-            for enemy in self.enemies[:]:
-                if enemy.current_health <= 0:
-                    self.enemies.remove(enemy)
-                    self.combat_system.remove_enemy(enemy)
+            # Remove dead enemies, compacting the list in one pass
+            alive_enemies = [enemy for enemy in self.enemies if enemy.current_health > 0]
+            if len(alive_enemies) != len(self.enemies):
+                for enemy in self.enemies:
+                    if enemy.current_health <= 0:
+                        self.combat_system.remove_enemy(enemy)
                         # Could spawn items or give experience here
+                self.enemies[:] = alive_enemies
             
             # Enemy attacks are handled in combat_system.update() above
         
@@ -936,9 +941,9 @@ class GameScene(Scene):
         self._check_stage_clear()
         
         # Update doors
-        player_pos = (self.player.x, self.player.y) if self.player else None
-        for door in self.doors:
-            door.update(dt, player_pos)
+        if self.doors:
+            player_pos = (self.player.x, self.player.y) if self.player else None
+            Door.update_batch(self.doors, dt, player_pos)
         
         # Handle door interactions
         self._handle_door_interactions()
@@ -998,16 +1003,16 @@ class GameScene(Scene):
             camera_x, camera_y = self.camera.get_offset()
         
         # Render items
-        for item in self.items:
-            item.render(screen, camera_x, camera_y)
+        if self.items:
+            Item.render_batch(self.items, screen, camera_x, camera_y)
         
         # Render doors
-        for door in self.doors:
-            door.render(screen, camera_x, camera_y)
+        if self.doors:
+            Door.render_batch(self.doors, screen, camera_x, camera_y)
         
         # Render enemies
-        for enemy in self.enemies:
-            enemy.render(screen, camera_x, camera_y)
+        if self.enemies:
+            Enemy.render_batch(self.enemies, screen, camera_x, camera_y)
         
         # Render player
         if self.player:
@@ -69,18 +69,15 @@ class ItemSystem:
             player: Player object for collection detection
         """
         # Update all active items
-        for item in self.items[:]:  # Use slice to avoid modification during iteration
-            if item.active:
-                item.update(dt)
-                
-                # Check for collection
-                if item.can_be_collected_by(player):
-                    if item.collect(player):
-                        self.collected_items.append(item)
-                        self.remove_item(item)
-            else:
-                # Remove inactive items
-                self.remove_item(item)
+        Item.update_batch(self.items, dt)
+        
+        # Check for collection against all items in one pass
+        for item in Item.find_collectible(self.items, player.get_center()):
+            if item.collect(player):
+                self.collected_items.append(item)
+        
+        # Remove collected and inactive items
+        self.items[:] = [item for item in self.items if item.active]
     
     def render(self, screen: pygame.Surface, camera_x: float = 0, camera_y: float = 0) -> None:
         """
@@ -91,9 +88,7 @@ class ItemSystem:
             camera_x: Camera X offset
             camera_y: Camera Y offset
         """
-        for item in self.items:
-            if item.active:
-                item.render(screen, camera_x, camera_y)
+        Item.render_batch(self.items, screen, camera_x, camera_y)
     
     def get_items_near_position(self, x: float, y: float, radius: float) -> List[Item]:
         """
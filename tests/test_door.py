@@ -0,0 +1,171 @@
+"""
+Unit tests for the Door class.
+"""
+import unittest
+from unittest.mock import MagicMock
+import pygame
+from src.objects.door import Door
+
+
+class TestDoor(unittest.TestCase):
+    """Test cases for Door class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        import os
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        pygame.init()
+        pygame.display.set_mode((1, 1))  # Minimal display for testing
+        
+        # Start from an empty shared sprite cache
+        Door._sprite_cache.clear()
+        Door._indicator_surface = None
+        Door._glow_cache.clear()
+        
+        self.door = Door(100, 100, 'test_door', 'next_map.json', (50, 50))
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        pygame.quit()
+    
+    def test_door_creation(self):
+        """Test basic door creation."""
+        self.assertEqual(self.door.door_id, 'test_door')
+        self.assertEqual(self.door.get_transition_data(), ('next_map.json', (50, 50)))
+        self.assertTrue(self.door.is_locked)
+        self.assertFalse(self.door.is_open)
+        self.assertIsInstance(self.door.sprite, pygame.Surface)
+    
+    def test_doors_share_state_sprites(self):
+        """Test that doors of the same size share cached state sprites."""
+        other = Door(300, 300, 'other_door')
+        self.assertIs(self.door.sprite, other.sprite)
+        
+        self.door.unlock()
+        self.assertIsNot(self.door.sprite, other.sprite)
+        
+        other.unlock()
+        self.assertIs(self.door.sprite, other.sprite)
+    
+    def test_unlock_and_open(self):
+        """Test unlocking and opening changes state and sprite."""
+        locked_sprite = self.door.sprite
+        
+        # Locked doors cannot be opened
+        self.door.open()
+        self.assertFalse(self.door.is_open)
+        
+        self.door.unlock()
+        unlocked_sprite = self.door.sprite
+        self.assertFalse(self.door.is_locked)
+        self.assertIsNot(unlocked_sprite, locked_sprite)
+        
+        self.door.open()
+        self.assertTrue(self.door.is_open)
+        self.assertTrue(self.door.can_pass_through())
+        self.assertIsNot(self.door.sprite, unlocked_sprite)
+    
+    def test_interaction_range(self):
+        """Test that interaction requires an unlocked door within range."""
+        center = (self.door.x + self.door.width / 2, self.door.y + self.door.height / 2)
+        
+        # Locked door cannot be interacted with even when close
+        self.door.update(0.016, center)
+        self.assertFalse(self.door.can_interact)
+        
+        self.door.unlock()
+        self.door.update(0.016, center)
+        self.assertTrue(self.door.can_interact)
+        
+        # Exactly on the interaction radius still counts
+        self.door.update(0.016, (center[0] + self.door.interaction_radius, center[1]))
+        self.assertTrue(self.door.can_interact)
+        
+        self.door.update(0.016, (center[0] + self.door.interaction_radius + 1, center[1]))
+        self.assertFalse(self.door.can_interact)
+    
+    def test_update_batch_matches_update(self):
+        """Test that batched updates give the same result as per-door updates."""
+        batched = Door(100, 100, 'batched_door')
+        for door in (self.door, batched):
+            door.unlock()
+        
+        player_position = (self.door.x + 20, self.door.y + 20)
+        self.door.update(0.5, player_position)
+        Door.update_batch([batched], 0.5, player_position)
+        
+        self.assertEqual(batched.glow_time, self.door.glow_time)
+        self.assertEqual(batched.unlock_animation_time, self.door.unlock_animation_time)
+        self.assertEqual(batched.can_interact, self.door.can_interact)
+        self.assertTrue(batched.can_interact)
+    
+    def test_get_info_tracks_state(self):
+        """Test that the cached info snapshot reflects state changes."""
+        info = self.door.get_info()
+        self.assertEqual(info['door_id'], 'test_door')
+        self.assertEqual(info['position'], (100, 100))
+        self.assertTrue(info['is_locked'])
+        
+        self.door.unlock()
+        self.door.open()
+        info = self.door.get_info()
+        self.assertFalse(info['is_locked'])
+        self.assertTrue(info['is_open'])
+    
+    def test_bounds_follow_set_position(self):
+        """Test that the cached bounds are reused and follow position changes."""
+        bounds = self.door.get_bounds()
+        self.assertEqual(bounds, pygame.Rect(100, 100, 32, 32))
+        self.assertIs(self.door.get_bounds(), bounds)
+        
+        self.door.get_info()
+        self.door.set_position(200, 150)
+        self.assertEqual(self.door.get_bounds().topleft, (200, 150))
+        self.assertEqual(self.door.get_info()['position'], (200, 150))
+        
+        # Interaction checks use the moved center
+        self.door.unlock()
+        self.door.update(0.016, (216, 166))
+        self.assertTrue(self.door.can_interact)
+        self.door.update(0.016, (116, 116))
+        self.assertFalse(self.door.can_interact)
+    
+    def test_render(self):
+        """Test rendering a door in every visual state."""
+        screen = MagicMock()
+        screen.get_width.return_value = 200
+        screen.get_height.return_value = 200
+        center = (self.door.x + self.door.width / 2, self.door.y + self.door.height / 2)
+        
+        # Locked doors draw only their sprite
+        self.door.render(screen, 0, 0)
+        screen.blit.assert_called_once_with(self.door.sprite, (100, 100))
+        
+        # Unlocked doors in range add the glow behind and the indicator above
+        screen.reset_mock()
+        self.door.unlock()
+        self.door.update(0.016, center)
+        self.door.render(screen, 0, 0)
+        positions = [call[0][1] for call in screen.blit.call_args_list]
+        self.assertEqual(positions, [(96, 96), (100, 100), (104, 68)])
+        self.assertIs(screen.blit.call_args_list[1][0][0], self.door.sprite)
+        
+        # Offscreen doors draw nothing
+        screen.reset_mock()
+        self.door.open()
+        self.door.render(screen, 500, 0)
+        screen.blit.assert_not_called()
+    
+    def test_render_batch(self):
+        """Test batched rendering draws visible doors and skips offscreen ones."""
+        screen = pygame.Surface((200, 200))
+        offscreen = Door(1000, 1000, 'offscreen_door')
+        
+        Door.render_batch([self.door, offscreen], screen, 0, 0)
+        
+        # The locked door sprite color is drawn at the door position
+        self.assertEqual(screen.get_at((101, 101))[:3], self.door.locked_color)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -58,10 +58,12 @@ class TestGame(unittest.TestCase):
         
         # Check that pygame was initialized
         mock_init.assert_called_once()
-        mock_mixer_init.assert_called_once()
+        
+        # Audio is initialized lazily by the resource manager, not at startup
+        mock_mixer_init.assert_not_called()
         
         # Check that display was set up correctly
-        mock_set_mode.assert_called_once_with((640, 480))
+        mock_set_mode.assert_called_once_with((640, 480), pygame.DOUBLEBUF)
         mock_caption.assert_called_once_with("Test Game")
         
         # Check configuration was loaded correctly
@@ -139,8 +141,9 @@ class TestGame(unittest.TestCase):
     @patch('pygame.mixer.init')
     @patch('pygame.display.set_mode')
     @patch('pygame.display.set_caption')
+    @patch('pygame.event.pump')
     @patch('pygame.event.get')
-    def test_handle_events_quit(self, mock_get_events, mock_caption, mock_set_mode, mock_mixer_init, mock_init):
+    def test_handle_events_quit(self, mock_get_events, mock_pump, mock_caption, mock_set_mode, mock_mixer_init, mock_init):
         """Test that quit event is handled correctly."""
         mock_screen = MagicMock()
         mock_set_mode.return_value = mock_screen
@@ -156,13 +159,18 @@ class TestGame(unittest.TestCase):
         # Handle events should set running to False
         game.handle_events()
         self.assertFalse(game.running)
+        
+        # Queue is pumped once and drained with the event filter
+        mock_pump.assert_called_once()
+        mock_get_events.assert_called_once_with(Game._EVENT_FILTER, pump=False)
     
     @patch('pygame.init')
     @patch('pygame.mixer.init')
     @patch('pygame.display.set_mode')
     @patch('pygame.display.set_caption')
+    @patch('pygame.event.pump')
     @patch('pygame.event.get')
-    def test_handle_events_escape(self, mock_get_events, mock_caption, mock_set_mode, mock_mixer_init, mock_init):
+    def test_handle_events_escape(self, mock_get_events, mock_pump, mock_caption, mock_set_mode, mock_mixer_init, mock_init):
         """Test that escape key quits the game."""
         mock_screen = MagicMock()
         mock_set_mode.return_value = mock_screen
@@ -179,6 +187,40 @@ class TestGame(unittest.TestCase):
         # Handle events should set running to False
         game.handle_events()
         self.assertFalse(game.running)
+    
+    @patch('pygame.init')
+    @patch('pygame.mixer.init')
+    @patch('pygame.display.set_mode')
+    @patch('pygame.display.set_caption')
+    def test_debug_mode_toggle(self, mock_caption, mock_set_mode, mock_mixer_init, mock_init):
+        """Test that F1 toggles debug mode and keeps config in sync."""
+        mock_screen = MagicMock()
+        mock_set_mode.return_value = mock_screen
+        
+        game = Game(self.temp_config.name)
+        self.assertTrue(game.debug_mode)
+        
+        f1_event = MagicMock()
+        f1_event.type = pygame.KEYDOWN
+        f1_event.key = pygame.K_F1
+        game._handle_keydown(f1_event)
+        
+        self.assertFalse(game.debug_mode)
+        self.assertFalse(game.config["game"]["debug_mode"])
+    
+    @patch('pygame.init')
+    @patch('pygame.mixer.init')
+    @patch('pygame.display.set_mode')
+    @patch('pygame.display.set_caption')
+    def test_set_mode_fallback_without_flags(self, mock_caption, mock_set_mode, mock_mixer_init, mock_init):
+        """Test that the window falls back to plain set_mode when flags are rejected."""
+        mock_screen = MagicMock()
+        mock_set_mode.side_effect = [pygame.error("flags not supported"), mock_screen]
+        
+        game = Game(self.temp_config.name)
+        
+        self.assertIs(game.screen, mock_screen)
+        mock_set_mode.assert_called_with((640, 480))
 
 
 if __name__ == '__main__':
@@ -57,6 +57,16 @@ class TestGameObject(unittest.TestCase):
         self.assertEqual(bounds.width, 32)
         self.assertEqual(bounds.height, 48)
     
+    def test_get_bounds_follows_position(self):
+        """Test that get_bounds reuses one Rect and tracks movement."""
+        bounds = self.game_object.get_bounds()
+        
+        self.game_object.set_position(50.7, 75.2)
+        moved = self.game_object.get_bounds()
+        
+        self.assertIs(moved, bounds)
+        self.assertEqual((moved.x, moved.y), (50, 75))
+    
     def test_get_position(self):
         """Test get_position method."""
         pos = self.game_object.get_position()
@@ -19,12 +19,16 @@ class TestGameOverScene(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures before each test method."""
-        # Mock pygame to avoid initialization issues
-        pygame.init = Mock()
-        pygame.display.set_mode = Mock(return_value=Mock())
-        pygame.display.set_caption = Mock()
-        pygame.time.Clock = Mock()
-        pygame.font.Font = Mock(return_value=Mock())
+        # Mock pygame to avoid initialization issues, restoring the real
+        # attributes after each test
+        for target, name, mock in ((pygame, 'init', Mock()),
+                                   (pygame.display, 'set_mode', Mock(return_value=Mock())),
+                                   (pygame.display, 'set_caption', Mock()),
+                                   (pygame.time, 'Clock', Mock()),
+                                   (pygame.font, 'Font', Mock(return_value=Mock()))):
+            patcher = patch.object(target, name, mock)
+            patcher.start()
+            self.addCleanup(patcher.stop)
         
         # Create mock game instance
         self.mock_game = Mock()
@@ -20,11 +20,16 @@ class TestCombatIntegration(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        # Mock pygame
-        pygame.init = MagicMock()
-        pygame.Surface = MagicMock()
-        pygame.draw = MagicMock()
-        pygame.Rect = MagicMock()
+        # Mock pygame for this test only, restoring the real attributes afterwards
+        for name in ('init', 'Surface', 'draw', 'Rect'):
+            patcher = patch.object(pygame, name, MagicMock())
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        
+        # Drop mocked surfaces from the shared caches once the test is done
+        for cache in (Enemy._sprite_cache, Enemy._tint_cache, Enemy._attack_surface_cache,
+                      Enemy._health_bar_cache, Player._attack_surface_cache):
+            self.addCleanup(cache.clear)
         
         # Create combat system
         self.combat_system = CombatSystem()
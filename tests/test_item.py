@@ -2,6 +2,7 @@
 Unit tests for the Item class.
 """
 import unittest
+from unittest.mock import MagicMock
 import pygame
 from src.objects.item import Item
 from src.objects.player import Player
@@ -17,6 +18,11 @@ class TestItem(unittest.TestCase):
         pygame.init()
         pygame.display.set_mode((1, 1))  # Minimal display for testing
         
+        # Start from an empty shared sprite cache
+        Item._sprite_cache.clear()
+        Item._glow_cache.clear()
+        Item._consumable_handlers.clear()
+        
         self.test_x = 100
         self.test_y = 200
         self.player = Player(50, 50)
@@ -37,6 +43,24 @@ class TestItem(unittest.TestCase):
         self.assertFalse(item.collected)
         self.assertTrue(item.active)
     
+    def test_instance_attributes_use_slots(self):
+        """Test that every attribute set by __init__ is declared in __slots__."""
+        item = Item(self.test_x, self.test_y, 'speed_boots')
+        
+        self.assertFalse(hasattr(item, '__dict__'))
+    
+    def test_effect_is_copied_per_item(self):
+        """Test that items share their type definition but not their effect."""
+        first = Item(self.test_x, self.test_y, 'strength_potion')
+        second = Item(0, 0, 'strength_potion')
+        
+        self.assertIs(first.item_data, Item.ITEM_TYPES['strength_potion'])
+        self.assertIs(first.item_data, second.item_data)
+        
+        first.effect['duration'] = 0.1
+        self.assertEqual(second.effect['duration'], 30)
+        self.assertEqual(Item.ITEM_TYPES['strength_potion']['effect']['duration'], 30)
+    
     def test_invalid_item_type(self):
         """Test creation with invalid item type."""
         with self.assertRaises(ValueError):
@@ -111,6 +135,21 @@ class TestItem(unittest.TestCase):
         # Y position should not change for collected items
         self.assertEqual(item.y, original_y)
     
+    def test_update_batch_matches_update(self):
+        """Test that batched updates give the same bobbing as per-item updates."""
+        item = Item(self.test_x, self.test_y, 'health_potion')
+        batched = Item(self.test_x, self.test_y, 'health_potion')
+        collected = Item(self.test_x, self.test_y, 'mana_potion')
+        collected.collected = True
+        
+        for _ in range(3):
+            item.update(0.1)
+            Item.update_batch([batched, collected], 0.1)
+        
+        self.assertEqual(batched.bob_time, item.bob_time)
+        self.assertEqual(batched.y, item.y)
+        self.assertEqual(collected.y, self.test_y)
+    
     def test_can_be_collected_by_close_player(self):
         """Test collection detection when player is close."""
         item = Item(self.test_x, self.test_y, 'health_potion')
@@ -131,6 +170,40 @@ class TestItem(unittest.TestCase):
         
         self.assertFalse(item.can_be_collected_by(self.player))
     
+    def test_collection_radius_boundary_and_setter(self):
+        """Test that the collection radius is inclusive and can be changed."""
+        item = Item(self.test_x, self.test_y, 'health_potion')
+        
+        # Player center exactly one collection radius to the right of the item center
+        self.player.x = self.test_x + 12 + item.collection_radius - 16
+        self.player.y = self.test_y + 12 - 16
+        self.assertTrue(item.can_be_collected_by(self.player))
+        
+        self.player.x += 1
+        self.assertFalse(item.can_be_collected_by(self.player))
+        
+        item.collection_radius = 20
+        self.assertEqual(item.collection_radius, 20)
+        self.assertTrue(item.can_be_collected_by(self.player))
+    
+    def test_find_collectible_matches_can_be_collected_by(self):
+        """Test that the batched range check agrees with the per-item check."""
+        items = [
+            Item(self.test_x, self.test_y, 'health_potion'),
+            Item(self.test_x + 10, self.test_y, 'iron_sword'),
+            Item(self.test_x + 100, self.test_y + 100, 'mana_potion'),
+            Item(self.test_x, self.test_y + 5, 'magic_ring'),
+        ]
+        items[3].collected = True
+        self.player.x = self.test_x
+        self.player.y = self.test_y
+        
+        expected = [item for item in items if item.can_be_collected_by(self.player)]
+        found = Item.find_collectible(items, self.player.get_center())
+        
+        self.assertEqual(found, expected)
+        self.assertEqual(found, items[:2])
+    
     def test_cannot_collect_already_collected_item(self):
         """Test that already collected items cannot be collected again."""
         item = Item(self.test_x, self.test_y, 'health_potion')
@@ -161,6 +234,31 @@ class TestItem(unittest.TestCase):
         self.assertFalse(item.active)
         self.assertEqual(self.player.current_health, 100)  # 50 + 50 healing
     
+    def test_collect_logs_debug_message(self):
+        """Test that collecting an item reports it through the module logger."""
+        item = Item(self.test_x, self.test_y, 'experience_gem')
+        self.player.x = self.test_x
+        self.player.y = self.test_y
+        
+        with self.assertLogs(Item.__module__, level='DEBUG') as logs:
+            self.assertTrue(item.collect(self.player))
+        
+        self.assertIn("Collected Experience Gem: Grants 25 experience points",
+                      [record.getMessage() for record in logs.records])
+    
+    def test_consumable_handler_resolved_once_per_type(self):
+        """Test that each item type binds its consumable handler on first use."""
+        self.player.current_health = 50
+        
+        self.assertTrue(Item(0, 0, 'health_potion').use_on_player(self.player))
+        self.assertTrue(Item(0, 0, 'strength_potion').use_on_player(self.player))
+        
+        self.assertEqual(Item._consumable_handlers, {
+            'health_potion': Item._apply_health_effect,
+            'strength_potion': Item._apply_boost_effect,
+        })
+        self.assertIn('strength_potion_effect', self.player.status_effects)
+    
     def test_health_potion_full_health_goes_to_inventory(self):
         """Test that health potion goes to inventory when player has full health."""
         item = Item(self.test_x, self.test_y, 'health_potion')
@@ -265,12 +363,13 @@ class TestItem(unittest.TestCase):
         """Test getting all item types."""
         item_types = Item.get_item_types()
         
-        self.assertIsInstance(item_types, dict)
+        self.assertEqual(dict(item_types), Item.ITEM_TYPES)
         self.assertIn('health_potion', item_types)
         self.assertIn('iron_sword', item_types)
         
-        # Ensure it's a copy, not the original
-        item_types['test'] = {}
+        # Ensure it's a read-only view, not the original dict
+        with self.assertRaises(TypeError):
+            item_types['test'] = {}
         self.assertNotIn('test', Item.ITEM_TYPES)
     
     def test_item_sprite_creation(self):
@@ -280,7 +379,50 @@ class TestItem(unittest.TestCase):
             self.assertIsNotNone(item.sprite)
             self.assertEqual(item.sprite.get_width(), 24)
             self.assertEqual(item.sprite.get_height(), 24)
+    
+    def test_render_reuses_glow_surface(self):
+        """Test that rendering reuses one cached glow surface per color."""
+        screen = MagicMock()
+        screen.get_size.return_value = (400, 400)
+        first = Item(self.test_x, self.test_y, 'health_potion')
+        second = Item(200, 100, 'health_potion')
+        
+        first.render(screen)
+        second.render(screen)
+        
+        self.assertEqual(list(Item._glow_cache), [(28, 28, first.color)])
+        glow_surface = Item._glow_cache[(28, 28, first.color)]
+        self.assertIs(first._glow_surface, glow_surface)
+        self.assertIs(second._glow_surface, glow_surface)
+        screen.blit.assert_any_call(glow_surface, (self.test_x - 2, self.test_y - 2))
+        screen.blit.assert_any_call(glow_surface, (198, 98))
+    
+    def test_render_batch_culls_offscreen_items(self):
+        """Test that batched rendering draws visible items and skips the rest."""
+        screen = MagicMock()
+        screen.get_clip.return_value = MagicMock(left=0, top=0, right=400, bottom=400)
+        visible = Item(self.test_x, self.test_y, 'health_potion')
+        offscreen = Item(1000, 1000, 'health_potion')
+        collected = Item(50, 50, 'iron_sword')
+        collected.collected = True
+        
+        Item.render_batch([visible, offscreen, collected], screen, 0, 0)
+        
+        screen.blits.assert_called_once_with([
+            (visible._get_glow_surface(), (self.test_x - 2, self.test_y - 2)),
+            (visible.sprite, (self.test_x, self.test_y)),
+        ], doreturn=False)
+    
+    def test_items_share_type_sprite(self):
+        """Test that items of the same type share one cached sprite."""
+        first = Item(self.test_x, self.test_y, 'health_potion')
+        second = Item(0, 0, 'health_potion')
+        other = Item(0, 0, 'iron_sword')
+        
+        self.assertIs(first.sprite, second.sprite)
+        self.assertIs(other.sprite, Item._sprite_cache[('iron_sword', 24, 24)])
+        self.assertEqual(len(Item._sprite_cache), 2)
 
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
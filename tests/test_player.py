@@ -20,10 +20,18 @@ class TestPlayer(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        # Mock pygame
-        pygame.init = MagicMock()
-        pygame.Surface = MagicMock()
-        pygame.draw = MagicMock()
+        # Mock pygame for this test only, restoring the real attributes afterwards
+        for name in ('init', 'Surface', 'draw'):
+            patcher = patch.object(pygame, name, MagicMock())
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        
+        # Drop mocked surfaces from the shared caches once the test is done
+        self.addCleanup(Player._attack_surface_cache.clear)
+        
+        # Start from an empty settings cache
+        Player._settings_cache.clear()
+        Player._attack_surface_cache.clear()
         
         # Sample settings
         self.sample_settings = {
@@ -56,6 +64,27 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(player.x, 50)
         self.assertEqual(player.y, 75)
     
+    def test_settings_file_parsed_once_until_modified(self):
+        """Test that players share parsed settings until the file changes."""
+        import tempfile
+        with tempfile.TemporaryDirectory() as temp_dir:
+            settings_path = os.path.join(temp_dir, 'settings.json')
+            with open(settings_path, 'w', encoding='utf-8') as f:
+                json.dump(self.sample_settings, f)
+            
+            with patch('json.load', wraps=json.load) as mock_json_load:
+                first = Player(0, 0, settings_path)
+                second = Player(0, 0, settings_path)
+                self.assertEqual(mock_json_load.call_count, 1)
+                self.assertIs(first.settings, second.settings)
+                self.assertEqual(second.speed, 150)
+                
+                # A newer modification time forces a reload
+                mtime = os.stat(settings_path).st_mtime
+                os.utime(settings_path, (mtime + 10, mtime + 10))
+                Player(0, 0, settings_path)
+                self.assertEqual(mock_json_load.call_count, 2)
+    
     def test_initial_stats(self):
         """Test that player has correct initial stats."""
         player = Player(0, 0)
@@ -68,6 +97,12 @@ class TestPlayer(unittest.TestCase):
         self.assertFalse(player.is_moving)
         self.assertEqual(len(player.inventory), 0)
     
+    def test_instance_attributes_use_slots(self):
+        """Test that every attribute set by __init__ is declared in __slots__."""
+        player = Player(0, 0)
+        
+        self.assertEqual(vars(player), {})
+    
     def test_handle_input_movement(self):
         """Test that player handles movement input correctly."""
         player = Player(100, 100)
@@ -108,9 +143,31 @@ class TestPlayer(unittest.TestCase):
         input_system.get_movement_vector.return_value = (0.0, 0.0)
         input_system.is_action_just_pressed.side_effect = lambda action: action == 'attack'
         
-        with patch('builtins.print') as mock_print:
+        with self.assertLogs(Player.__module__, level='DEBUG') as logs:
             player.handle_input(input_system)
-            mock_print.assert_called_with("Player attacks in direction: down")
+        self.assertEqual(logs.records[-1].getMessage(), "Player attacks in direction: down")
+    
+    def test_handle_input_skips_unchanged_movement(self):
+        """Test that repeated input only resolves the facing direction once."""
+        player = Player(100, 100)
+        input_system = MagicMock()
+        input_system.get_movement_vector.return_value = (0.0, -1.0)
+        input_system.get_movement_direction.return_value = 'up'
+        input_system.is_action_just_pressed.return_value = False
+        
+        for _ in range(3):
+            player.handle_input(input_system)
+        
+        input_system.get_movement_direction.assert_called_once_with()
+        self.assertEqual(player.velocity_y, -player.base_speed)
+        self.assertEqual(player.facing_direction, 'up')
+        # Actions are still polled every frame
+        self.assertEqual(input_system.is_action_just_pressed.call_count, 6)
+        
+        # A speed change re-applies the same input
+        player.apply_status_effect('haste', {'speed_boost': 2.0, 'duration': 1.0})
+        player.handle_input(input_system)
+        self.assertEqual(player.velocity_y, -player.base_speed * 2.0)
     
     def test_handle_input_interact(self):
         """Test that player handles interact input."""
@@ -120,9 +177,9 @@ class TestPlayer(unittest.TestCase):
         input_system.get_movement_vector.return_value = (0.0, 0.0)
         input_system.is_action_just_pressed.side_effect = lambda action: action == 'interact'
         
-        with patch('builtins.print') as mock_print:
+        with self.assertLogs(Player.__module__, level='DEBUG') as logs:
             player.handle_input(input_system)
-            mock_print.assert_called_with("Player interacts")
+        self.assertEqual(logs.records[-1].getMessage(), "Player interacts")
     
     def test_update_position(self):
         """Test that player position updates based on velocity."""
@@ -164,77 +221,77 @@ class TestPlayer(unittest.TestCase):
         """Test that player takes damage correctly."""
         player = Player(100, 100)
         
-        with patch('builtins.print') as mock_print:
+        with self.assertLogs(Player.__module__, level='DEBUG') as logs:
             player.take_damage(25)
             
             self.assertEqual(player.current_health, 75)
-            mock_print.assert_called_with("Player takes 25 damage. Health: 75/100")
+        self.assertEqual(logs.records[-1].getMessage(), "Player takes 25 damage. Health: 75/100")
     
     def test_take_damage_death(self):
         """Test that player dies when health reaches 0."""
         player = Player(100, 100)
         player.current_health = 10
         
-        with patch('builtins.print') as mock_print:
+        with self.assertLogs(Player.__module__, level='DEBUG') as logs:
             player.take_damage(15)
             
             self.assertEqual(player.current_health, 0)
-            # Should print both damage and death messages
-            self.assertEqual(mock_print.call_count, 2)
+        # Should log both damage and death messages
+        self.assertEqual(len(logs.records), 2)
+        self.assertEqual(logs.records[-1].getMessage(), "Player has died!")
     
     def test_heal(self):
         """Test that player heals correctly."""
         player = Player(100, 100)
         player.current_health = 50
         
-        with patch('builtins.print') as mock_print:
+        with self.assertLogs(Player.__module__, level='DEBUG') as logs:
             player.heal(30)
             
             self.assertEqual(player.current_health, 80)
-            mock_print.assert_called_with("Player healed for 30. Health: 80/100")
+        self.assertEqual(logs.records[-1].getMessage(), "Player healed for 30. Health: 80/100")
     
     def test_heal_max_health(self):
         """Test that healing doesn't exceed max health."""
         player = Player(100, 100)
         player.current_health = 90
         
-        with patch('builtins.print') as mock_print:
+        with self.assertLogs(Player.__module__, level='DEBUG') as logs:
             player.heal(20)
             
             self.assertEqual(player.current_health, 100)
-            mock_print.assert_called_with("Player healed for 10. Health: 100/100")
+        self.assertEqual(logs.records[-1].getMessage(), "Player healed for 10. Health: 100/100")
     
     def test_add_experience(self):
         """Test that player gains experience correctly."""
         player = Player(100, 100)
         
-        with patch('builtins.print') as mock_print:
+        with self.assertLogs(Player.__module__, level='DEBUG') as logs:
             player.add_experience(50)
             
             self.assertEqual(player.experience, 50)
-            mock_print.assert_called_with("Player gains 50 experience. Total: 50")
+        self.assertEqual(logs.records[-1].getMessage(), "Player gains 50 experience. Total: 50")
     
     def test_level_up(self):
         """Test that player levels up correctly."""
         player = Player(100, 100)
         
-        with patch('builtins.print') as mock_print:
-            player.add_experience(100)  # Should trigger level up
-            
-            self.assertEqual(player.level, 2)
-            self.assertEqual(player.max_health, 110)
-            self.assertEqual(player.current_health, 110)
+        player.add_experience(100)  # Should trigger level up
+        
+        self.assertEqual(player.level, 2)
+        self.assertEqual(player.max_health, 110)
+        self.assertEqual(player.current_health, 110)
     
     def test_add_item(self):
         """Test that items are added to inventory correctly."""
         player = Player(100, 100)
         
-        with patch('builtins.print') as mock_print:
+        with self.assertLogs(Player.__module__, level='DEBUG') as logs:
             result = player.add_item("Health Potion")
-            
-            self.assertTrue(result)
-            self.assertIn("Health Potion", player.inventory)
-            mock_print.assert_called_with("Added Health Potion to inventory")
+        
+        self.assertTrue(result)
+        self.assertIn("Health Potion", player.inventory)
+        self.assertEqual(logs.records[-1].getMessage(), "Added Health Potion to inventory")
     
     def test_add_item_full_inventory(self):
         """Test that items are rejected when inventory is full."""
@@ -243,34 +300,34 @@ class TestPlayer(unittest.TestCase):
         # Fill inventory
         player.inventory = ["Item"] * player.max_inventory_size
         
-        with patch('builtins.print') as mock_print:
+        with self.assertLogs(Player.__module__, level='DEBUG') as logs:
             result = player.add_item("New Item")
-            
-            self.assertFalse(result)
-            mock_print.assert_called_with("Inventory is full!")
+        
+        self.assertFalse(result)
+        self.assertEqual(logs.records[-1].getMessage(), "Inventory is full!")
     
     def test_remove_item(self):
         """Test that items are removed from inventory correctly."""
         player = Player(100, 100)
         player.inventory = ["Health Potion", "Sword"]
         
-        with patch('builtins.print') as mock_print:
+        with self.assertLogs(Player.__module__, level='DEBUG') as logs:
             result = player.remove_item("Health Potion")
-            
-            self.assertTrue(result)
-            self.assertNotIn("Health Potion", player.inventory)
-            mock_print.assert_called_with("Removed Health Potion from inventory")
+        
+        self.assertTrue(result)
+        self.assertNotIn("Health Potion", player.inventory)
+        self.assertEqual(logs.records[-1].getMessage(), "Removed Health Potion from inventory")
     
     def test_remove_item_not_found(self):
         """Test removing item that doesn't exist in inventory."""
         player = Player(100, 100)
         player.inventory = ["Sword"]
         
-        with patch('builtins.print') as mock_print:
+        with self.assertLogs(Player.__module__, level='DEBUG') as logs:
             result = player.remove_item("Health Potion")
-            
-            self.assertFalse(result)
-            mock_print.assert_called_with("Health Potion not found in inventory")
+        
+        self.assertFalse(result)
+        self.assertEqual(logs.records[-1].getMessage(), "Health Potion not found in inventory")
     
     def test_get_health_percentage(self):
         """Test health percentage calculation."""
@@ -329,20 +386,24 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(player.boundary_right, 300)
         self.assertEqual(player.boundary_bottom, 400)
     
+    def _move_by(self, player, dx, dy):
+        """Move the player by (dx, dy) over a 0.1 second update."""
+        player.velocity_x = dx * 10
+        player.velocity_y = dy * 10
+        player.update(0.1)
+        return player.x, player.y
+    
     def test_boundary_constraints_x(self):
         """Test that player is constrained by X boundaries."""
         player = Player(100, 100)
         player.set_boundaries(50, 50, 200, 200)
         
         # Test left boundary
-        constrained_x, constrained_y = player._apply_boundary_constraints(30, 100)
-        self.assertEqual(constrained_x, 50)  # Should be clamped to left boundary
-        self.assertEqual(constrained_y, 100)
+        self.assertEqual(self._move_by(player, -70, 0), (50, 100))  # Clamped to left boundary
         
         # Test right boundary (account for player width)
-        constrained_x, constrained_y = player._apply_boundary_constraints(180, 100)
-        self.assertEqual(constrained_x, 168)  # 200 - 32 (player width)
-        self.assertEqual(constrained_y, 100)
+        player.x = 100
+        self.assertEqual(self._move_by(player, 80, 0), (168, 100))  # 200 - 32 (player width)
     
     def test_boundary_constraints_y(self):
         """Test that player is constrained by Y boundaries."""
@@ -350,14 +411,11 @@ class TestPlayer(unittest.TestCase):
         player.set_boundaries(50, 50, 200, 200)
         
         # Test top boundary
-        constrained_x, constrained_y = player._apply_boundary_constraints(100, 30)
-        self.assertEqual(constrained_x, 100)
-        self.assertEqual(constrained_y, 50)  # Should be clamped to top boundary
+        self.assertEqual(self._move_by(player, 0, -70), (100, 50))  # Clamped to top boundary
         
         # Test bottom boundary (account for player height)
-        constrained_x, constrained_y = player._apply_boundary_constraints(100, 180)
-        self.assertEqual(constrained_x, 100)
-        self.assertEqual(constrained_y, 168)  # 200 - 32 (player height)
+        player.y = 100
+        self.assertEqual(self._move_by(player, 0, 80), (100, 168))  # 200 - 32 (player height)
     
     def test_is_at_boundary(self):
         """Test boundary detection."""
@@ -426,6 +484,19 @@ class TestPlayer(unittest.TestCase):
         for direction in expected_directions:
             self.assertIn(direction, player.direction_sprites)
     
+    def test_sprites_converted_to_display_format(self):
+        """Test that generated sprites are converted once a display exists."""
+        with patch('pygame.display.get_surface', return_value=None):
+            player = Player(100, 100)
+        pygame.Surface.return_value.convert.assert_not_called()
+        
+        with patch('pygame.display.get_surface', return_value=MagicMock()):
+            player = Player(100, 100)
+        converted = pygame.Surface.return_value.convert.return_value
+        self.assertIs(player.sprite, converted)
+        for direction in ['up', 'down', 'left', 'right']:
+            self.assertIs(player.direction_sprites[direction], converted)
+    
     def test_facing_direction_persistence(self):
         """Test that facing direction persists when not moving."""
         player = Player(100, 100)
@@ -448,6 +519,20 @@ class TestPlayer(unittest.TestCase):
         # Should still be facing right
         self.assertEqual(player.last_facing_direction, 'right')
     
+    def test_facing_direction_maps_to_codes(self):
+        """Test that facing names are stored as codes and unknown names face down."""
+        player = Player(100, 100)
+        
+        player.facing_direction = 'left'
+        self.assertEqual(player.facing_direction, 'left')
+        self.assertIs(player._get_animated_sprite(), player.direction_sprites['down'])
+        
+        player.is_moving = True
+        self.assertIs(player._get_animated_sprite(), player.direction_sprites['left'])
+        
+        player.facing_direction = 'sideways'
+        self.assertEqual(player.facing_direction, 'down')
+    
     def test_get_movement_info(self):
         """Test movement information retrieval."""
         player = Player(100, 200)
@@ -495,6 +580,37 @@ class TestPlayer(unittest.TestCase):
         player.facing_direction = 'right'
         offset = player._get_animation_offset()
         self.assertEqual(offset, (1, 0))  # Horizontal movement
+        
+        player.facing_direction = 'up'
+        offset = player._get_animation_offset()
+        self.assertEqual(offset, (0, 1))  # Vertical movement
+    
+    def test_get_attack_rect_directions(self):
+        """Test that the attack area is placed on the facing side of the player."""
+        with patch('pygame.Rect'):
+            player = Player(100, 100)
+        player.attack_range = 40
+        expected = {
+            'up': (96, 60, 40, 40),
+            'down': (96, 132, 40, 40),
+            'left': (60, 96, 40, 40),
+            'right': (132, 96, 40, 40),
+            'unknown': (96, 132, 40, 40),
+        }
+        
+        for direction, rect_args in expected.items():
+            player.facing_direction = direction
+            attack_rect = player.get_attack_rect()
+            attack_rect.update.assert_called_with(*rect_args)
+        
+        # The same Rect is reused for every call
+        self.assertIs(player.get_attack_rect(), attack_rect)
+        
+        # Offsets are shared and follow range changes
+        self.assertIn((40, 32, 32), Player._attack_offset_cache)
+        player.attack_range = 30
+        player.facing_direction = 'left'
+        player.get_attack_rect().update.assert_called_with(70, 101, 30, 30)
     
     def test_update_with_boundaries(self):
         """Test that update respects boundaries."""
@@ -511,41 +627,156 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(player.x, 50)
         self.assertEqual(player.y, 100)
     
+    def test_update_clamps_to_far_boundaries(self):
+        """Test that update clamps against the far edges, accounting for player size."""
+        player = Player(100, 100)
+        player.set_boundaries(50, 50, 200, 200)
+        
+        player.velocity_x = 200
+        player.velocity_y = 200
+        player.update(1.0)
+        self.assertEqual((player.x, player.y), (168, 168))  # 200 - 32
+        
+        # A smaller sprite moves the limits with the new size
+        sprite = MagicMock()
+        sprite.get_width.return_value = 16
+        sprite.get_height.return_value = 24
+        player.set_sprite(sprite)
+        player.update(1.0)
+        self.assertEqual((player.x, player.y), (184, 176))
+    
     def test_attack_basic(self):
         """Test basic attack functionality."""
         player = Player(100, 100)
         
-        with patch('time.time', return_value=1.0):
-            with patch('builtins.print') as mock_print:
-                player.attack()
-                
-                self.assertTrue(player.is_attacking)
-                self.assertEqual(player.attack_time, 0.0)
-                self.assertEqual(player.last_attack_time, 1.0)
-                mock_print.assert_called_with("Player attacks in direction: down")
+        player.update_status_effects(1.0)  # Advance the game clock
+        
+        with self.assertLogs(Player.__module__, level='DEBUG') as logs:
+            player.attack()
+            
+            self.assertTrue(player.is_attacking)
+            self.assertEqual(player.attack_time, 0.0)
+            self.assertEqual(player.last_attack_time, 1.0)
+        self.assertEqual(logs.records[-1].getMessage(), "Player attacks in direction: down")
     
     def test_attack_cooldown(self):
         """Test that attack has cooldown."""
         player = Player(100, 100)
         
-        with patch('time.time', side_effect=[1.0, 1.2]):  # 0.2 seconds later
-            player.attack()  # First attack
-            self.assertTrue(player.is_attacking)
-            
-            player.attack()  # Second attack (should be blocked by cooldown)
-            # Should still be in first attack state
-            self.assertTrue(player.is_attacking)
+        player.attack()  # First attack
+        self.assertTrue(player.is_attacking)
+        player.is_attacking = False  # Simulate attack finishing
+        
+        player.update_status_effects(0.2)  # 0.2 seconds later
+        player.attack()  # Second attack (should be blocked by cooldown)
+        self.assertFalse(player.is_attacking)
     
     def test_attack_after_cooldown(self):
         """Test that attack works after cooldown period."""
         player = Player(100, 100)
         
-        with patch('time.time', side_effect=[1.0, 2.0]):  # 1 second later (> cooldown)
-            player.attack()  # First attack
-            player.is_attacking = False  # Simulate attack finishing
-            
-            player.attack()  # Second attack (should work)
-            self.assertTrue(player.is_attacking)
+        player.attack()  # First attack
+        player.is_attacking = False  # Simulate attack finishing
+        
+        player.update_status_effects(1.0)  # 1 second later (> cooldown)
+        player.attack()  # Second attack (should work)
+        self.assertTrue(player.is_attacking)
+    
+    def test_reapplied_status_effect_expires_at_new_end_time(self):
+        """Test that re-applying an effect replaces its pending expiry."""
+        player = Player(100, 100)
+        boost = {'attack_boost': 10, 'duration': 1.0}
+        
+        player.apply_status_effect('strength', boost)
+        player.update_status_effects(0.5)
+        player.apply_status_effect('strength', boost)  # Now ends at 1.5
+        
+        player.update_status_effects(0.6)
+        self.assertTrue(player.has_status_effect('strength'))
+        self.assertEqual(player.temporary_attack_bonus, 10)
+        
+        player.update_status_effects(0.5)
+        self.assertFalse(player.has_status_effect('strength'))
+        self.assertEqual(player.temporary_attack_bonus, 0)
+    
+    def test_resolved_speed_and_attack_follow_modifiers(self):
+        """Test that movement speed and total attack track effects and equipment."""
+        player = Player(100, 100)
+        input_system = MagicMock()
+        input_system.get_movement_vector.return_value = (1.0, 0.0)
+        input_system.get_movement_direction.return_value = 'right'
+        input_system.is_action_just_pressed.return_value = False
+        
+        player.apply_status_effect('haste', {'speed_boost': 1.5, 'attack_boost': 5, 'duration': 1.0})
+        player.handle_input(input_system)
+        self.assertEqual(player._get_current_speed(), player.base_speed * 1.5)
+        self.assertEqual(player.velocity_x, player.base_speed * 1.5)
+        self.assertEqual(player.get_total_attack_damage(), 25)
+        
+        # Equipment changes the base damage directly
+        player.attack_damage += 10
+        self.assertEqual(player.get_total_attack_damage(), 35)
+        
+        player.remove_status_effect('haste')
+        player.handle_input(input_system)
+        self.assertEqual(player._get_current_speed(), player.base_speed)
+        self.assertEqual(player.velocity_x, player.base_speed)
+        self.assertEqual(player.get_total_attack_damage(), 30)
+    
+    def test_render_reads_screen_clip_once(self):
+        """Test that rendering an attacking player queries the screen clip area once."""
+        player = Player(100, 100)
+        player.is_attacking = True
+        screen = MagicMock()
+        screen.get_clip.return_value = pygame.Rect(0, 0, 800, 600)
+        attack_rect = MagicMock(x=96, y=132, width=40, height=40)
+        
+        with patch.object(Player, 'get_attack_rect', return_value=attack_rect):
+            player.render(screen)
+        
+        screen.get_clip.assert_called_once_with()
+        screen.get_size.assert_not_called()
+        self.assertEqual(screen.blit.call_count, 2)  # Sprite and attack effect
+        
+        # The attack surface is built once and reused on later frames
+        attack_surface = Player._attack_surface_cache[(40, 40)]
+        screen.blit.assert_called_with(attack_surface, (96, 132))
+        with patch.object(Player, 'get_attack_rect', return_value=attack_rect):
+            player.render(screen)
+        self.assertEqual(len(Player._attack_surface_cache), 1)
+        screen.blit.assert_called_with(attack_surface, (96, 132))
+    
+    def test_render_culls_outside_clip_area(self):
+        """Test that nothing is drawn when the player is outside the clip area."""
+        player = Player(100, 100)
+        # pygame.rect.Rect stays real even when other tests replace pygame.Rect
+        player._screen_rect = pygame.rect.Rect(0, 0, player.width, player.height)
+        screen = MagicMock()
+        screen.get_clip.return_value = pygame.rect.Rect(0, 0, 200, 200)
+        
+        player.render(screen, camera_x=-150, camera_y=0)  # Drawn at x=250
+        player.render(screen, camera_x=0, camera_y=132)  # Bottom edge touches y=0
+        screen.blit.assert_not_called()
+        
+        player.render(screen, camera_x=0, camera_y=131)  # One row visible
+        self.assertEqual(screen.blit.call_count, 1)
+    
+    def test_animation_frames_are_reused(self):
+        """Test that offset and attack-tinted frames are built once and reused."""
+        player = Player(100, 100)
+        player.is_moving = True
+        player.animation_frame = 1
+        
+        step_frame = player._get_animated_sprite()
+        self.assertIs(player._get_animated_sprite(), step_frame)
+        
+        player.is_attacking = True
+        player.attack_time = 0.05  # Wind-up phase
+        windup_frame = player._get_animated_sprite()
+        player.attack_time = 0.08  # Still winding up
+        self.assertIs(player._get_animated_sprite(), windup_frame)
+        
+        self.assertEqual(len(player._sprite_variants), 2)
     
     def test_attack_state_update(self):
         """Test that attack state updates correctly over time."""
@@ -14,7 +14,7 @@ from unittest.mock import patch, MagicMock
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from core.resource_manager import ResourceManager, ResourceLoadError
+from core.resource_manager import ResourceManager, ResourceLoadError, NO_COLORKEY
 
 
 class TestResourceManager(unittest.TestCase):
@@ -79,7 +79,7 @@ class TestResourceManager(unittest.TestCase):
         
         # Check default image exists
         self.assertIn("__default__", self.resource_manager.image_cache)
-        default_img = self.resource_manager.image_cache["__default__"]
+        default_img = self.resource_manager.image_cache["__default__"][NO_COLORKEY]
         self.assertIsInstance(default_img, pygame.Surface)
         self.assertEqual(default_img.get_size(), (32, 32))
     
@@ -109,9 +109,9 @@ class TestResourceManager(unittest.TestCase):
         # Verify image loaded
         self.assertIsInstance(loaded_image, pygame.Surface)
         
-        # Verify cached with colorkey
-        cache_key = "test_colorkey.png_(255, 0, 255)"
-        self.assertIn(cache_key, self.resource_manager.image_cache)
+        # Verify cached under the path, keyed by colorkey
+        self.assertIn("test_colorkey.png", self.resource_manager.image_cache)
+        self.assertIn(0xFF00FF, self.resource_manager.image_cache["test_colorkey.png"])
     
     def test_load_image_file_not_found(self):
         """Test image loading when file doesn't exist."""
@@ -124,6 +124,16 @@ class TestResourceManager(unittest.TestCase):
         # Should be cached
         self.assertIn("nonexistent.png", self.resource_manager.image_cache)
     
+    def test_load_image_missing_reported_once(self):
+        """Test that a missing image is remembered and resolves to the default image."""
+        with self.assertLogs('core.resource_manager', level='WARNING') as logs:
+            first = self.resource_manager.load_image("missing.png")
+            second = self.resource_manager.load_image("missing.png", colorkey=(255, 0, 255))
+        
+        self.assertIs(first, self.resource_manager.default_image)
+        self.assertIs(second, self.resource_manager.default_image)
+        self.assertEqual(len(logs.output), 1)
+    
     def test_load_image_caching(self):
         """Test that images are properly cached."""
         # Create test image
@@ -157,7 +167,9 @@ class TestResourceManager(unittest.TestCase):
     def test_load_map_file_not_found(self):
         """Test map loading when file doesn't exist."""
         # Try to load non-existent map
-        loaded_map = self.resource_manager.load_map("nonexistent.json")
+        with self.assertLogs('core.resource_manager', level='WARNING') as logs:
+            loaded_map = self.resource_manager.load_map("nonexistent.json")
+        self.assertIn("nonexistent.json", logs.output[0])
         
         # Should return default map
         self.assertIsInstance(loaded_map, dict)